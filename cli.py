@@ -3,82 +3,121 @@ import json
 import sys
 import os
 
+try:
+    # optional: a much faster encoder for large exports
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.controllers import XMLController
 from src.utils import file_io
 
-parser = argparse.ArgumentParser(description="use XML editor in CLI mode")
-commands =parser.add_subparsers(dest='command', help='Available functionalities',required=True)
 
-verify_arg = commands.add_parser('verify', help= 'verify the structure of the XML provided')
-verify_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
-verify_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
-verify_arg.add_argument('-f', "--fix", required=False, action='store_true', help='fix the XML file...')
+def make_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for every CLI sub-command."""
+    parser = argparse.ArgumentParser(description="use XML editor in CLI mode")
+    commands =parser.add_subparsers(dest='command', help='Available functionalities',required=True)
+
+    verify_arg = commands.add_parser('verify', help= 'verify the structure of the XML provided')
+    verify_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
+    verify_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
+    verify_arg.add_argument('-f', "--fix", required=False, action='store_true', help='fix the XML file...')
+
+    format_arg = commands.add_parser('format', help= 'formatting the xml file to the standard format')
+    format_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
+    format_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
 
-format_arg = commands.add_parser('format', help= 'formatting the xml file to the standard format')
-format_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
-format_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
+    json_arg = commands.add_parser('json', help= 'transform the XMl file to a json format file')
+    json_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
+    json_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
 
-json_arg = commands.add_parser('json', help= 'transform the XMl file to a json format file')
-json_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
-json_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
+    mini_arg = commands.add_parser('mini', help= 'strip spaces in XML file')
+    mini_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
+    mini_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
 
-mini_arg = commands.add_parser('mini', help= 'strip spaces in XML file')
-mini_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
-mini_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
+    compress_arg = commands.add_parser('compress', help= 'compressing XML file to specified destination')
+    compress_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
+    compress_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
 
-compress_arg = commands.add_parser('compress', help= 'compressing XML file to specified destination')
-compress_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
-compress_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
+    decompress_arg = commands.add_parser('decompress', help= 'decompressing XML file to specified destination')
+    decompress_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
+    decompress_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
+    return parser
 
-decompress_arg = commands.add_parser('decompress', help= 'decompressing XML file to specified destination')
-decompress_arg.add_argument('-i',"--input",required=True,type=str,help='Path to the input XML file')
-decompress_arg.add_argument('-o',"--output",required=False,type=str,help='Path to the output XML file')
 
+def emit(text: str) -> None:
+    """
+    Write a whole result to stdout in a single call.
+    Goes through the text stream, so newline translation and the console
+    encoding apply exactly as they did with print().
+    """
+    sys.stdout.write(text + "\n")
 
-if len(sys.argv) == 1:
+
+def write_json(path: str, data) -> None:
+    """Write data as 2-space indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def main(argv=None) -> None:
+    """Run one CLI command; argv defaults to sys.argv[1:]."""
+    parser = make_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
         parser.print_help()
         sys.exit(1)
 
-editor = XMLController()
-args = parser.parse_args()
-if args.command == 'verify':
-    if args.fix and args.output is None:
-        print("invalid usage")
-
-    if file_io.read_file(args.input)[0]:
-        editor.set_xml_string(file_io.read_file(args.input)[1])
-        annotated_xml, error_counts = editor.validate()
-        editor.set_xml_string(annotated_xml)
-        ack = editor.format()
-        if args.output is not None:
-            file_io.write_file(args.output, ack)
-        print(ack)
-    else:
-        print("invalid path")
-
-if args.command == 'format':
-    if file_io.read_file(args.input)[0]:
-        editor.set_xml_string(file_io.read_file(args.input)[1])
-        ack = editor.format()
-        if args.output is not None:
-            file_io.write_file(args.output,ack)
-        print(ack)
-    else:
-        print("invalid file path")
-
-if args.command == 'json':
-    ack = file_io.read_file(args.input)
-    if ack[0]:
-        editor.set_xml_string(file_io.read_file(args.input)[1])
-        bool_mes, _, json_data = editor.export_to_json()
-        if bool_mes:
+    args = parser.parse_args(argv)
+    # built only once arguments are valid, so --help and usage errors skip it
+    editor = XMLController()
+    if args.command == 'verify':
+        if args.fix and args.output is None:
+            print("invalid usage")
+
+        source = file_io.read_file(args.input)
+        if source.ok:
+            editor.set_xml_string(source.data)
+            annotated_xml, error_counts = editor.validate()
+            editor.set_xml_string(annotated_xml)
+            ack = editor.format()
             if args.output is not None:
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
+                file_io.write_file(args.output, ack)
+            emit(ack)
+        else:
+            print("invalid path")
+
+    if args.command == 'format':
+        source = file_io.read_file(args.input)
+        if source.ok:
+            editor.set_xml_string(source.data)
+            ack = editor.format()
+            if args.output is not None:
+                file_io.write_file(args.output,ack)
+            emit(ack)
+        else:
+            print("invalid file path")
+
+    if args.command == 'json':
+        source = file_io.read_file(args.input)
+        if source.ok:
+            editor.set_xml_string(source.data)
+            json_data = editor.export_to_json()
+            if args.output is not None:
+                write_json(args.output, json_data)
             else:
-                print(f"json data format: \n\n{json_data}")
+                emit(f"json data format: \n\n{json_data}")
         else:
-            print("invalid argument")
+            print("invalid file path")
+
+
+if __name__ == "__main__":
+    main()
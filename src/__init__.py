@@ -11,7 +11,6 @@ __author__ = "SocialNet Parser Team"
 from .controllers import XMLController
 # from .controllers import DataController  # TODO: Implement DataController if needed
 from .utils import ByteUtils
-from .ui import CodeViewerWindow, LandingWindow, ManualWindow, BrowseWindow, BaseXMLWindow
 from .utils import read_file, write_file, read_binary, write_binary, pretty_format
 from .utils import is_opening_tag, is_closing_tag, extract_tag_name, tokenize
 
@@ -34,3 +33,15 @@ __all__ = [
     'extract_tag_name',
     'tokenize'
 ]
+
+# UI classes pull in PySide6, so they are imported on first access only;
+# the CLI never touches them and should not pay for Qt at startup.
+_UI_EXPORTS = ('CodeViewerWindow', 'BaseXMLWindow', 'BrowseWindow', 'ManualWindow', 'LandingWindow')
+
+
+def __getattr__(name):
+    """Resolve the UI classes lazily from the ui package (PEP 562)."""
+    if name in _UI_EXPORTS:
+        from . import ui
+        return getattr(ui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,6 @@ Controllers package for business logic.
 """
 
 from .xml_controller import XMLController
-from .graph_controller import GraphController
 from ..utils import ByteUtils
 
 __all__ = [
@@ -11,3 +10,11 @@ __all__ = [
     'GraphController',
     'ByteUtils'
 ]
+
+
+def __getattr__(name):
+    """Import GraphController on first access; it pulls in networkx and numpy (PEP 562)."""
+    if name == 'GraphController':
+        from .graph_controller import GraphController
+        return GraphController
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
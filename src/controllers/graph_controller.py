@@ -70,14 +70,17 @@ class GraphController:
         """Build a NetworkX directed graph from nodes and edges."""
         G = nx.DiGraph()
         
-        # Add all nodes
-        for node_id, node_name in nodes.items():
-            G.add_node(str(node_id), name=node_name)
+        # Add all nodes in one bulk call
+        G.add_nodes_from((str(node_id), {'name': node_name}) for node_id, node_name in nodes.items())
         
-        # Add all edges (from_id follows to_id means edge from from_id to to_id)
-        for from_id, to_id in edges:
-            if str(from_id) in G.nodes() and str(to_id) in G.nodes():
-                G.add_edge(str(from_id), str(to_id))
+        # Add all edges (from_id follows to_id means edge from from_id to to_id),
+        # skipping edges that point at unknown users; each id is converted once
+        node_ids = G.nodes
+        G.add_edges_from(
+            (from_id, to_id)
+            for from_id, to_id in ((str(a), str(b)) for a, b in edges)
+            if from_id in node_ids and to_id in node_ids
+        )
         
         return G
     
@@ -93,34 +96,39 @@ class GraphController:
         metrics['num_edges'] = self.G.number_of_edges()
         metrics['density'] = nx.density(self.G)
         
-        # Degree metrics (in-degree = followers, out-degree = following)
-        in_degrees = dict(self.G.in_degree())
-        out_degrees = dict(self.G.out_degree())
+        # Degree metrics (in-degree = followers, out-degree = following),
+        # held as integer vectors aligned with node_ids
+        node_ids = list(self.G.nodes())
+        num_nodes = len(node_ids)
+        in_arr = np.fromiter((d for _, d in self.G.in_degree()), dtype=np.int32, count=num_nodes)
+        out_arr = np.fromiter((d for _, d in self.G.out_degree()), dtype=np.int32, count=num_nodes)
         
-        metrics['avg_in_degree'] = np.mean(list(in_degrees.values())) if in_degrees else 0
-        metrics['avg_out_degree'] = np.mean(list(out_degrees.values())) if out_degrees else 0
+        metrics['avg_in_degree'] = in_arr.mean() if num_nodes else 0
+        metrics['avg_out_degree'] = out_arr.mean() if num_nodes else 0
         
         # Most influential (most followers)
-        if in_degrees:
-            most_influential_id = max(in_degrees, key=in_degrees.get)
+        if num_nodes:
+            idx = int(in_arr.argmax())
+            most_influential_id = node_ids[idx]
             metrics['most_influential'] = {
                 'id': most_influential_id,
                 'name': nodes.get(most_influential_id, 'Unknown'),
-                'followers': in_degrees[most_influential_id]
+                'followers': int(in_arr[idx])
             }
         
         # Most active (follows most people)
-        if out_degrees:
-            most_active_id = max(out_degrees, key=out_degrees.get)
+        if num_nodes:
+            idx = int(out_arr.argmax())
+            most_active_id = node_ids[idx]
             metrics['most_active'] = {
                 'id': most_active_id,
                 'name': nodes.get(most_active_id, 'Unknown'),
-                'following': out_degrees[most_active_id]
+                'following': int(out_arr[idx])
             }
         
         # Store degree dictionaries for visualization
-        metrics['in_degrees'] = in_degrees
-        metrics['out_degrees'] = out_degrees
+        metrics['in_degrees'] = dict(zip(node_ids, in_arr.tolist()))
+        metrics['out_degrees'] = dict(zip(node_ids, out_arr.tolist()))
         
         return metrics
     
@@ -14,11 +14,68 @@ Key Features:
 
 """
 
+import heapq
 import textwrap
 import re
-from typing import List, Tuple, Optional, Any, Dict
+import sys
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import List, Tuple, Optional, Any, Dict, Iterator
 from ..utils.binary_utils import ByteUtils
 
+# Token kinds yielded by XMLController._iter_tokens
+TEXT_TOKEN = 0
+OPEN_TAG = 1  # also declarations, comments and self-closing tags
+CLOSE_TAG = 2
+
+# One token per match: a whole tag, a run of text, or a dangling '<'
+_TOKEN_RE = re.compile(r'<[^>]*>|[^<]+|<')
+# An opening or closing tag within one line (validate annotates per line);
+# group 1 is '/' for closing tags, group 2 the name
+_LINE_TAG_RE = re.compile(r'<(/?)(\w+)[^>\n]*>')
+# Any non-empty '<...>'; for element tags group 1 is '/' or '' and group 2
+# the name, for anything else (declarations, comments, ...) group 2 is None
+_ANY_TAG_RE = re.compile(r'<(?:(/?)(\w+)[^>]*|[^>]+)>')
+# A whole document that is a single leaf element: <tag>text</tag>, matching
+# the same tag and text tokens that _TOKEN_RE would produce
+_SINGLE_LEAF_RE = re.compile(r'\s*(<(?!/)[^>]*>)([^<]*)(</[^>]*>)\s*')
+# Tags that open or close a record in export_to_json; any other tag only
+# changes the current container
+_RECORD_TAGS = frozenset(('user', 'post', 'follower', 'following'))
+# A UTF-16 surrogate code unit, as decompression produces for characters
+# beyond the BMP
+_SURROGATE_RE = re.compile('[\ud800-\udfff]')
+# A run of non-space characters
+_WORD_RE = re.compile(r'[^ ]+')
+# name="value" and name='value' attributes
+_DQ_ATTR_RE = re.compile(r'(\w+)="([^"]*)"')
+_SQ_ATTR_RE = re.compile(r"(\w+)='([^']*)'")
+
+
+def _wrap_text(text: str, width: int) -> List[str]:
+    """
+    Wrap single-spaced text at spaces without ever splitting a word.
+
+    Gives the same lines as textwrap.wrap(text, width, break_long_words=False)
+    with a single greedy pass. Hyphenated text is handed to textwrap itself,
+    since it may also break a line after a hyphen.
+    """
+    if '-' in text:
+        return textwrap.wrap(text, width, break_long_words=False)
+
+    lines = []
+    line_start = 0  # index of the first word of the current line
+    line_end = 0  # end of the last word that fits on the current line
+    for word in _WORD_RE.finditer(text):
+        if word.end() - line_start > width and line_end > line_start:
+            lines.append(text[line_start:line_end])
+            line_start = word.start()
+        line_end = word.end()
+    if line_end > line_start:
+        lines.append(text[line_start:line_end])
+    return lines
+
 
 class XMLController:
     """
@@ -35,6 +92,9 @@ class XMLController:
         xml_string (str): The XML content to be processed
     """
 
+    # Indentation prefix for each nesting level, built once for all instances
+    _INDENTS: Tuple[str, ...] = tuple("    " * depth for depth in range(128))
+
     def __init__(self, xml: str = None) -> None:
         """
         Initialize the XMLController with optional XML content.
@@ -47,6 +107,7 @@ class XMLController:
         """
         self.xml_string: str = xml if xml is not None else ""
         self.xml_data: Optional[None] = None  # placeholder for parsed XML data structure,avoid attributes error
+        self._format_cache: Optional[Tuple[str, str]] = None  # (source xml, formatted xml) of the last format()
         if xml: self.set_xml_string(xml)  # initialize with provided XML
 
     # ===================================================================
@@ -94,37 +155,39 @@ class XMLController:
             Input:  "<user><name>Ali</name></user>"
             Output: ['<user>', '<name>', 'Ali', '</name>', '</user>']
         """
-        tokens = []
-        i = 0
-        length = len(self.xml_string)
-
-        while i < length:
-            if self.xml_string[i] == '<':
-                j = self.xml_string.find('>', i)
-
-                if j == -1:
-                    break
+        return [token for _, token in self._iter_tokens()]
 
-                tag = self.xml_string[i:j + 1]
-                tokens.append(tag)
-                i = j + 1
-
-            else:
-                j = i
+    def _iter_tokens(self, xml: Optional[str] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Lazily yield the tokens of the XML string in document order.
 
-                while j < length and self.xml_string[j] != '<':
-                    j += 1
+        Produces the same tokens as _get_tokens(), one at a time, from a single
+        compiled-regex scan, so callers can stream over the document without
+        materializing the whole token list first. Each token is paired with
+        its kind, decided once here so callers branch on an int.
 
-                raw_text = self.xml_string[i:j]
+        Args:
+            xml (str, optional): Document to scan. Defaults to the current
+                XML string.
 
-                if not raw_text.strip():
-                    i = j
-                    continue
+        Yields:
+            Tuple[int, str]: (TEXT_TOKEN, OPEN_TAG or CLOSE_TAG, the tag or
+            stripped text)
+        """
+        if xml is None:
+            xml = self.xml_string
+        for match in _TOKEN_RE.finditer(xml):
+            token = match.group()
 
-                tokens.append(raw_text.strip())
-                i = j
+            if token[0] == '<':
+                if token == '<':  # unterminated tag, nothing more to read
+                    break
+                yield (CLOSE_TAG if token[1] == '/' else OPEN_TAG), token
 
-        return tokens
+            else:
+                text = token.strip()  # stripped once, then tested and yielded
+                if text:
+                    yield TEXT_TOKEN, text
 
     def _get_tag_info(self, token: str) -> Tuple[str, Dict[str, str]]:
         """
@@ -138,11 +201,10 @@ class XMLController:
         """
         tag_content = token.strip('<>').strip('/')  # remove angle brackets and slashes
 
-        tag_name = tag_content.split(' ')[0]  # extract tag name
+        tag_name = sys.intern(tag_content.split(' ')[0])  # extract tag name; interned so compares are by identity
         attributes = {}  # dictionary to hold attributes
         # use regex to find all attribute in " " and appends with those in ''
-        attr_matches = re.findall(r'(\w+)="([^"]*)"', tag_content) + \
-                       re.findall(r"(\w+)='([^']*)'", tag_content)
+        attr_matches = _DQ_ATTR_RE.findall(tag_content) + _SQ_ATTR_RE.findall(tag_content)
 
         for name, value in attr_matches:
             attributes[name] = value.strip()
@@ -166,52 +228,93 @@ class XMLController:
         Returns:
             str: Beautifully formatted XML string with newlines
         """
-        tokens = self._get_tokens()
+        # Re-formatting an unchanged document returns the previous result.
+        # The cache is keyed on the content itself, so direct assignments to
+        # xml_string are picked up as well as set_xml_string().
+        source = self.xml_string
+        cached = self._format_cache
+        if cached is not None and cached[0] == source:
+            return cached[1]
+
+        MAX_WIDTH = 80
+
+        # A lone short leaf formats to itself on one line; skip the token walk
+        leaf = _SINGLE_LEAF_RE.fullmatch(source)
+        if leaf is not None:
+            clean_text = " ".join(leaf.group(2).split())
+            if clean_text and len(clean_text) <= MAX_WIDTH:
+                result = f"{leaf.group(1)}{clean_text}{leaf.group(3)}"
+                self._format_cache = (source, result)
+                return result
+
         formatted = []
+        emit = formatted.append  # bound once for the hot loop
         level = 0
         indentation = "    "
-        k = 0
-        MAX_WIDTH = 80
+        # Prefix per level; kept at least two entries deeper than `level`
+        # because wrapped text is written at level + 1
+        indents = list(self._INDENTS)
+
+        # An opening tag (and the text right after it) is held back until the
+        # next token shows whether together they form a leaf: <tag>text</tag>
+        pending_tag = None
+        pending_text = None
+
+        for kind, token in self._iter_tokens(source):  # the same text the cache is keyed on
+            is_tag = kind != TEXT_TOKEN
+            is_closing = kind == CLOSE_TAG
+
+            if pending_tag is not None:
+                if pending_text is None and not is_tag:
+                    pending_text = token
+                    continue
 
-        while k < len(tokens):
-            token = tokens[k]
+                if pending_text is not None and is_closing:
+                    clean_text = " ".join(pending_text.split())
 
-            if token.startswith('</'):
-                level = max(0, level - 1)
-                formatted.append((indentation * level) + token)
+                    if len(clean_text) > MAX_WIDTH:
+                        emit(indents[level] + pending_tag)
+                        for line in _wrap_text(clean_text, MAX_WIDTH):
+                            emit(indents[level + 1] + line)
+                        emit(indents[level] + token)
+                    else:
+                        # built in one go rather than through chained '+' temporaries
+                        emit(f"{indents[level]}{pending_tag}{clean_text}{token}")
 
-            elif token.startswith('<') and not token.startswith('</'):
-                if (k + 2 < len(tokens) and
-                        not tokens[k + 1].startswith('<') and
-                        tokens[k + 2].startswith('</')):
+                    pending_tag = pending_text = None
+                    continue
 
-                    text_content = tokens[k + 1]
-                    clean_text = " ".join(text_content.split())
+                # Not a leaf: the held tag opens a new nesting level
+                emit(indents[level] + pending_tag)
+                level += 1
+                if level + 1 >= len(indents):
+                    indents.append(indentation * (level + 1))
+                if pending_text is not None:
+                    emit(indents[level] + pending_text)
+                pending_tag = pending_text = None
 
-                    if len(clean_text) > MAX_WIDTH:
-                        formatted.append((indentation * level) + tokens[k])
-                        wrapper = textwrap.TextWrapper(
-                            width=MAX_WIDTH,
-                            break_long_words=False
-                        )
-                        wrapped_lines = wrapper.wrap(clean_text)
-                        for line in wrapped_lines:
-                            formatted.append((indentation * (level + 1)) + line)
-                        formatted.append((indentation * level) + tokens[k + 2])
-                    else:
-                        line = (indentation * level) + tokens[k] + clean_text + tokens[k + 2]
-                        formatted.append(line)
+            if is_closing:
+                level = max(0, level - 1)
+                emit(indents[level] + token)
+
+            elif is_tag:
+                pending_tag = token
 
-                    k += 2
-                else:
-                    formatted.append((indentation * level) + token)
-                    level += 1
             else:
-                formatted.append((indentation * level) + token.strip())
+                emit(indents[level] + token)
 
-            k += 1
+        # Flush a tag left open at the very end of the document
+        if pending_tag is not None:
+            emit(indents[level] + pending_tag)
+            level += 1
+            if level + 1 >= len(indents):
+                indents.append(indentation * (level + 1))
+            if pending_text is not None:
+                emit(indents[level] + pending_text)
 
-        return "\n".join(formatted)
+        result = "\n".join(formatted)
+        self._format_cache = (source, result)
+        return result
 
     # ===================================================================
     # SECTION 3: MINIFY METHOD
@@ -252,57 +355,63 @@ class XMLController:
         mismatch_count = 0
         missing_count = 0
 
-        # Split string into a list of lines.
-        # We will modify this list directly to add annotations.
-        lines = self.xml_string.split('\n')
-
-        # We create a separate list for output to avoid modifying the logic
-        # while iterating (though strings are immutable, this keeps it clean).
-        annotated_lines = lines[:]
-
-        for line_idx, line in enumerate(lines):
-            # Regex to find tags: captures <tag> or </tag>
-            # Group 1: '/' if closing, empty if opening
-            # Group 2: The tag name
-            tags = re.finditer(r'<(/?)(\w+)[^>]*>', line)
-
-            for match in tags:
-                is_closing = match.group(1) == '/'
-                tag_name = match.group(2)
-
-                if not is_closing:
-                    # OPENING TAG: Push tag name and Line Index to stack
-                    stack.append({'tag': tag_name, 'line_idx': line_idx})
+        # Annotations to append, keyed by line index. Lines are only split
+        # apart at the end, when the annotations are attached.
+        notes = {}
+
+        # One regex sweep over the whole document. Tags never span lines
+        # ([^>\n]), so this finds exactly what a line-by-line scan would;
+        # the line number is tracked by counting newlines between matches.
+        xml = self.xml_string
+        count_newlines = xml.count
+        push = stack.append
+        line_idx = 0
+        last_pos = 0
+
+        # Regex to find tags: captures <tag> or </tag>
+        # Group 1: '/' if closing, empty if opening
+        # Group 2: The tag name
+        for match in _LINE_TAG_RE.finditer(xml):
+            start = match.start()
+            line_idx += count_newlines('\n', last_pos, start)
+            last_pos = start
+
+            is_closing = match.group(1) == '/'
+            tag_name = sys.intern(match.group(2))  # repeated names share one object
+
+            if not is_closing:
+                # OPENING TAG: Push (tag name, line index) to stack
+                push((tag_name, line_idx))
+            else:
+                # CLOSING TAG
+                if not stack:
+                    # Error: Closing tag found, but stack is empty
+                    orphan_count += 1
+                    notes[line_idx] = notes.get(line_idx, "") + \
+                        f" <--- ORPHAN TAG: Found </{tag_name}> but no opening tag exists."
                 else:
-                    # CLOSING TAG
-                    if not stack:
-                        # Error: Closing tag found, but stack is empty
-                        orphan_count += 1
-                        annotated_lines[line_idx] += f" <--- ORPHAN TAG: Found </{tag_name}> but no opening tag exists."
+                    top_tag = stack[-1][0]
+                    if top_tag == tag_name:
+                        # Match found, valid pair
+                        stack.pop()
                     else:
-                        top = stack[-1]
-                        if top['tag'] == tag_name:
-                            # Match found, valid pair
-                            stack.pop()
-                        else:
-                            # Error: Mismatch
-                            # We found a closing tag, but it doesn't match the most recent opening tag.
-                            mismatch_count += 1
-                            annotated_lines[
-                                line_idx] += f" <--- MISMATCH: Expected </{top['tag']}>, found </{tag_name}>."
+                        # Error: Mismatch
+                        # We found a closing tag, but it doesn't match the most recent opening tag.
+                        mismatch_count += 1
+                        notes[line_idx] = notes.get(line_idx, "") + \
+                            f" <--- MISMATCH: Expected </{top_tag}>, found </{tag_name}>."
 
-                            # Logic Decision:
-                            # We do NOT pop the stack here. We assume the current closing tag is the error
-                            # and the previous opening tag still needs a mate later on.
+                        # Logic Decision:
+                        # We do NOT pop the stack here. We assume the current closing tag is the error
+                        # and the previous opening tag still needs a mate later on.
 
         # After processing all lines, check if the stack is not empty.
         # These are tags that were opened but never closed.
         while stack:
             missing_count += 1
-            leftover = stack.pop()
+            leftover_tag, idx = stack.pop()
             # We go back to the line where this tag was opened and add the error there
-            idx = leftover['line_idx']
-            annotated_lines[idx] += f" <--- MISSING CLOSING TAG: Tag <{leftover['tag']}> is never closed."
+            notes[idx] = notes.get(idx, "") + f" <--- MISSING CLOSING TAG: Tag <{leftover_tag}> is never closed."
 
         # Build error counts dictionary
         error_counts = {
@@ -312,7 +421,16 @@ class XMLController:
             'total': orphan_count + mismatch_count + missing_count
         }
 
-        # Join the lines back into a single string to be displayed in the UI text box
+        # A clean document is returned as-is: splitting and re-joining it
+        # would only rebuild the same string
+        if not notes:
+            return xml, error_counts
+
+        # Attach the annotations and join the lines back into a single string
+        # to be displayed in the UI text box
+        annotated_lines = xml.split('\n')
+        for idx, note in notes.items():
+            annotated_lines[idx] += note
         annotated_string = "\n".join(annotated_lines)
         return annotated_string, error_counts
 
@@ -330,67 +448,81 @@ class XMLController:
                 - Dictionary with correction counts: {'missing_tags_added': int, 'stray_tags_removed': int, 'mismatches_fixed': int, 'total_corrections': int}
         """
         stack = []
+        open_counts = defaultdict(int)  # tag name -> times it is on the stack, for O(1) "in stack"
         
         # Initialize correction counters
         missing_tags_added = 0
         stray_tags_removed = 0
         mismatches_fixed = 0
 
-        # We need to parse slightly differently: we want to rebuild the string
-        # Regex to tokenize: Tag OR non-tag content
-        tokens = re.split(r'(<[^>]+>)', self.xml_string)
-
+        # We need to parse slightly differently: we want to rebuild the string.
+        # One regex sweep finds every '<...>' tag and, for element tags, its
+        # name in the same match; the text between two tags is copied through.
+        xml = self.xml_string
         corrected_output = []
+        emit = corrected_output.append
+        text_start = 0  # start of the text not yet copied to the output
 
-        for token in tokens:
-            if not token:
-                continue
+        for match in _ANY_TAG_RE.finditer(xml):
+            lt = match.start()
+            if lt > text_start:
+                # Just text content, append as is
+                emit(xml[text_start:lt])
+            token = match.group()
+            text_start = match.end()
 
-            # Check if this token is a tag
-            match = re.match(r'<(/?)(\w+)[^>]*>', token)
+            # Group 2 is only set for element tags: <name ...> or </name>
+            tag_name = match.group(2)
 
-            if match:
+            if tag_name is not None:
                 is_closing = match.group(1) == '/'
-                tag_name = match.group(2)
+                tag_name = sys.intern(tag_name)  # repeated names share one object
 
                 if not is_closing:
                     # OPENING TAG
                     stack.append(tag_name)
-                    corrected_output.append(token)
+                    open_counts[tag_name] += 1
+                    emit(token)
                 else:
                     # CLOSING TAG
                     if stack and stack[-1] == tag_name:
                         # Perfectly matches
                         stack.pop()
-                        corrected_output.append(token)
+                        open_counts[tag_name] -= 1
+                        emit(token)
                     else:
                         # MISMATCH SCENARIO
                         # Strategy: If it matches a parent higher up, close the intermediates.
                         # If it matches nothing, ignore it (delete stray closing tag).
 
-                        if tag_name in stack:
+                        if open_counts[tag_name] > 0:
                             # It is valid, but we forgot to close something in between
                             # Example: <a> <b> </a> -> We need to close <b> first
                             while stack[-1] != tag_name:
                                 missing_tag = stack.pop()
-                                corrected_output.append(f"</{missing_tag}>")
+                                open_counts[missing_tag] -= 1
+                                emit(f"</{missing_tag}>")
                                 mismatches_fixed += 1  # Track intermediate tag closure
 
                             # Now pop the matching tag
                             stack.pop()
-                            corrected_output.append(token)
+                            open_counts[tag_name] -= 1
+                            emit(token)
                         else:
                             # It's a stray closing tag that wasn't opened. Ignore/Delete it.
                             stray_tags_removed += 1  # Track removed stray tag
                             pass
             else:
-                # Just text content, append as is
-                corrected_output.append(token)
+                # Not an element tag (declaration, comment, ...): keep it as text
+                emit(token)
+
+        if text_start < len(xml):
+            emit(xml[text_start:])
 
         # Final cleanup: Close any tags left open at the end
         while stack:
             missing_tag = stack.pop()
-            corrected_output.append(f"</{missing_tag}>")
+            emit(f"</{missing_tag}>")
             missing_tags_added += 1  # Track added missing closing tag
 
         # Build correction counts dictionary
@@ -418,7 +550,6 @@ class XMLController:
             tuple: (success: bool, message: str, error: str)
         """
 
-        tokens = self._get_tokens()
         json_data = {"users": []}
 
         # state variables for custom parsing
@@ -427,62 +558,65 @@ class XMLController:
         relationship_dict = None  # NEW: state variable to temporarily hold a follower/following object before appending
         current_container = None  # tracks if we are inside 'name', 'body', 'topic', ... etc.
         parent_stack = []  # Stack to track parent tag hierarchy for proper context
-        i = 0
-        while i < len(tokens):
-            token = tokens[i]
+        get_tag_info = self._get_tag_info
+
+        # tokens are consumed as they are scanned; the document is never held as a token list
+        for kind, token in self._iter_tokens():
 
             # ---------------------------------------------------------------
             # CASE A: Opening Tag (e.g., <user>, <name>)
             # ---------------------------------------------------------------
-            if token.startswith('<') and not token.startswith('</'):
-                tag_name, attrs = self._get_tag_info(token)
-
-                if tag_name == 'user':
-                    # start of a new user record
-                    user_dict = {
-                        "id": attrs.get('id'),  # extract ID from attribute
-                        "name": None,
-                        "posts": [],
-                        "followers": [],
-                        "followings": []
-                    }
-
-                elif tag_name == 'post' and user_dict is not None:
-                    # start of a new post record
-                    post_dict = {
-                        "content": None,
-                        "topics": []
-                    }
-                elif tag_name == 'follower' or tag_name == 'following':  # NEW: If we start a relationship tag
-                    relationship_dict = {}  # NEW: Initialize the object we need to build, e.g., {"id": "..."}
+            if kind == OPEN_TAG:
+                tag_name, attrs = get_tag_info(token)
+
+                if tag_name in _RECORD_TAGS:  # one hash lookup skips the chain for name, id, body, ...
+                    if tag_name == 'user':
+                        # start of a new user record
+                        user_dict = {
+                            "id": attrs.get('id'),  # extract ID from attribute
+                            "name": None,
+                            "posts": [],
+                            "followers": [],
+                            "followings": []
+                        }
+
+                    elif tag_name == 'post' and user_dict is not None:
+                        # start of a new post record
+                        post_dict = {
+                            "content": None,
+                            "topics": []
+                        }
+                    elif tag_name == 'follower' or tag_name == 'following':  # NEW: If we start a relationship tag
+                        relationship_dict = {}  # NEW: Initialize the object we need to build, e.g., {"id": "..."}
                 parent_stack.append(tag_name)
                 current_container = tag_name
 
             # ---------------------------------------------------------------
             # CASE B: Closing Tag (e.g., </user>, </name>)
             # ---------------------------------------------------------------
-            elif token.startswith('</'):
-                tag_name, _ = self._get_tag_info(token)
-
-                if tag_name == 'user' and user_dict is not None:
-                    # end of user record, finalize and append
-                    json_data["users"].append(user_dict)
-                    user_dict = None
-
-                elif tag_name == 'post' and user_dict is not None and post_dict is not None:
-                    # end of post record, finalize and append
-                    user_dict["posts"].append(post_dict)
-                    post_dict = None
-
-                elif tag_name == 'follower' and user_dict is not None and relationship_dict is not None:  # NEW: When </follower> closes
-                    user_dict["followers"].append(
-                        relationship_dict)  # NEW: Append the complete {"id": "X"} object to the list.
-                    relationship_dict = None  # NEW: Reset the temporary relationship dict.
-
-                elif tag_name == 'following' and user_dict is not None and relationship_dict is not None:  # NEW: When </following> closes
-                    user_dict["followings"].append(
-                        relationship_dict)  # NEW: Append the complete {"id": "X"} object to the list.
-                    relationship_dict = None  # NEW: Reset the temporary relationship dict.
+            elif kind == CLOSE_TAG:
+                tag_name, _ = get_tag_info(token)
+
+                if tag_name in _RECORD_TAGS:
+                    if tag_name == 'user' and user_dict is not None:
+                        # end of user record, finalize and append
+                        json_data["users"].append(user_dict)
+                        user_dict = None
+
+                    elif tag_name == 'post' and user_dict is not None and post_dict is not None:
+                        # end of post record, finalize and append
+                        user_dict["posts"].append(post_dict)
+                        post_dict = None
+
+                    elif tag_name == 'follower' and user_dict is not None and relationship_dict is not None:  # NEW: When </follower> closes
+                        user_dict["followers"].append(
+                            relationship_dict)  # NEW: Append the complete {"id": "X"} object to the list.
+                        relationship_dict = None  # NEW: Reset the temporary relationship dict.
+
+                    elif tag_name == 'following' and user_dict is not None and relationship_dict is not None:  # NEW: When </following> closes
+                        user_dict["followings"].append(
+                            relationship_dict)  # NEW: Append the complete {"id": "X"} object to the list.
+                        relationship_dict = None  # NEW: Reset the temporary relationship dict.
                 # Pop closing tag from the parent stack
                 if parent_stack and parent_stack[-1] == tag_name:
                     parent_stack.pop()
@@ -492,10 +626,7 @@ class XMLController:
             # CASE C: Text Content
             # ---------------------------------------------------------------
             else:
-                text_content = token.strip()
-                if not text_content:
-                    i += 1
-                    continue
+                text_content = token  # _iter_tokens yields text already stripped and non-empty
 
                 # assign content based on the most recently opened relevant tag
                 if current_container == 'name' and user_dict is not None and user_dict["name"] is None:
@@ -513,18 +644,16 @@ class XMLController:
                     # parent_stack[-1] is 'id', parent_stack[-2] is the parent tag
                     parent_tag = parent_stack[-2] if len(parent_stack) >= 2 else None
 
-                if parent_tag in ('follower', 'following') and relationship_dict is not None:
-                    # ID inside a follower or following tag
-                    relationship_dict["id"] = text_content
-                elif parent_tag == 'user' and user_dict is not None:
-                    # ID inside a user tag (but not inside a follower/following)
-                    if user_dict["id"] is None:  # Only assign if not already set by attribute
-                        user_dict["id"] = text_content
+                    if parent_tag in ('follower', 'following') and relationship_dict is not None:
+                        # ID inside a follower or following tag
+                        relationship_dict["id"] = text_content
+                    elif parent_tag == 'user' and user_dict is not None:
+                        # ID inside a user tag (but not inside a follower/following)
+                        if user_dict["id"] is None:  # Only assign if not already set by attribute
+                            user_dict["id"] = text_content
 
                 current_container = None  # reset container state after text processing
 
-            i += 1
-
         # final check
         final_user_count = len(json_data["users"])
 
@@ -539,65 +668,161 @@ class XMLController:
             return ""
 
         tokens = [ord(c) for c in self.xml_string]
-        merges = []  # List to preserve order
-        next_token = 256
+        if max(tokens) > 0xFFFF:
+            # Tokens are stored as u16: characters beyond the BMP go in as
+            # their UTF-16 surrogate pairs
+            units = array('H', self.xml_string.encode('utf-16-le', 'surrogatepass'))
+            if sys.byteorder == 'big':
+                units.byteswap()
+            tokens = units.tolist()
+        # Merge table in creation order, one unsigned 16-bit array per column:
+        # merge_left[k] + merge_right[k] -> merge_ids[k]
+        merge_left = array('H')
+        merge_right = array('H')
+        merge_ids = array('H')
+        # Merged ids are the u16 values from 256 up that no character in the
+        # text uses, so they cannot be mistaken for one; merging stops if
+        # they run out
+        used = set(tokens)
+        free_ids = (t for t in range(256, 0x10000) if t not in used)
+        next_token = next(free_ids, None)
+
+        # The sequence is a doubly linked list over the original positions, so
+        # a merge only touches the neighbours of each occurrence. A pair lives
+        # at the position of its left token; merged tokens keep that position.
+        n = len(tokens)
+        nxt = list(range(1, n + 1))
+        nxt[-1] = -1
+        prv = list(range(-1, n - 1))
+        occurrences = {}  # pair key -> positions where the pair currently starts
+        first_pos = {}  # pair key -> lower bound of its first position
+        touched = set()  # pair keys whose occurrences changed during a merge
+
+        def link(key, pos):
+            positions = occurrences.get(key)
+            if positions is None:
+                occurrences[key] = {pos}
+                first_pos[key] = pos
+            else:
+                positions.add(pos)
+                if pos < first_pos[key]:
+                    first_pos[key] = pos
+            touched.add(key)
+
+        def unlink(key, pos):
+            positions = occurrences[key]
+            positions.discard(pos)
+            if not positions:
+                del occurrences[key]
+            touched.add(key)
+
+        for i in range(n - 1):
+            link((tokens[i] << 16) | tokens[i + 1], i)
+
+        # Max-heap on count; ties go to the pair that occurs first in the
+        # sequence, as a left-to-right count would pick. Entries are pushed
+        # whenever a pair changes and checked lazily when they reach the top.
+        heap = [(-len(positions), first_pos[key], key) for key, positions in occurrences.items()]
+        heapq.heapify(heap)
 
         for _ in range(100):
-            pair_counts = {}
-            for i in range(len(tokens) - 1):
-                key = (tokens[i] << 16) | tokens[i + 1]
-                pair_counts[key] = pair_counts.get(key, 0) + 1
-
-            if not pair_counts:
-                break
-
             most_key = None
-            most_count = 0
-            for key, count in pair_counts.items():
-                if count > most_count:
-                    most_count = count
-                    most_key = key
+            while heap:
+                neg_count, first, key = heap[0]
+                positions = occurrences.get(key)
+                if positions is None or len(positions) != -neg_count:
+                    heapq.heappop(heap)  # count is out of date
+                    continue
+                true_first = min(positions)
+                if true_first != first:
+                    first_pos[key] = true_first
+                    heapq.heapreplace(heap, (neg_count, true_first, key))
+                    continue
+                most_key = key
+                break
 
-            if most_count < 2:
+            # A merge costs a 6-byte table entry and saves 2 bytes per
+            # occurrence, so pairs seen 3 times or fewer no longer pay off
+            if most_key is None or len(occurrences[most_key]) <= 3 or next_token is None:
                 break
 
             # Store with creation order
-            merges.append((most_key, next_token))
-
-            # Merge pass
-            new_tokens = []
-            i = 0
-            while i < len(tokens):
-                if i < len(tokens) - 1:
-                    key = (tokens[i] << 16) | tokens[i + 1]
-                    if key == most_key:
-                        new_tokens.append(next_token)
-                        i += 2
-                        continue
-                new_tokens.append(tokens[i])
-                i += 1
-
-            tokens = new_tokens
-            next_token += 1
-
-        # Serialize
-        out = bytearray()
-        out.extend(ByteUtils.pack_u32(len(merges)))
-
-        for key, merged in merges:
-            t1 = (key >> 16) & 0xFFFF
-            t2 = key & 0xFFFF
-            out.extend(ByteUtils.pack_u16(t1))
-            out.extend(ByteUtils.pack_u16(t2))
-            out.extend(ByteUtils.pack_u16(merged))
-
-        out.extend(ByteUtils.pack_u32(len(tokens)))
-        for t in tokens:
-            out.extend(ByteUtils.pack_u16(t))
-
-        return bytes([b if b < 256 else 63 for b in out]).decode("latin-1")
+            merge_left.append((most_key >> 16) & 0xFFFF)
+            merge_right.append(most_key & 0xFFFF)
+            merge_ids.append(next_token)
+
+            # Merge pass: left to right, skipping occurrences that overlap one
+            # already merged in this pass
+            touched.clear()
+            for p in sorted(occurrences[most_key]):
+                positions = occurrences.get(most_key)
+                if positions is None or p not in positions:
+                    continue
+                q = nxt[p]
+                r = nxt[q]
+                u = prv[p]
+
+                if u != -1:
+                    unlink((tokens[u] << 16) | tokens[p], u)
+                unlink(most_key, p)
+                if r != -1:
+                    unlink((tokens[q] << 16) | tokens[r], q)
+
+                tokens[p] = next_token
+                nxt[p] = r
+                if r != -1:
+                    prv[r] = p
+                    link((next_token << 16) | tokens[r], p)
+                if u != -1:
+                    link((tokens[u] << 16) | next_token, u)
+
+            for key in touched:
+                positions = occurrences.get(key)
+                if positions:
+                    heapq.heappush(heap, (-len(positions), first_pos[key], key))
+
+            next_token = next(free_ids, None)
+
+        # Read the surviving tokens back in sequence order
+        merged_tokens = []
+        p = 0
+        while p != -1:
+            merged_tokens.append(tokens[p])
+            p = nxt[p]
+        tokens = merged_tokens
+
+        # Serialize into one buffer sized up front (all little-endian):
+        # u32 merge count, u16 left/right/merged per merge, u32 token count,
+        # then one u16 per token
+        merge_count = len(merge_ids)
+        out = bytearray(4 + 6 * merge_count + 4 + 2 * len(tokens))
+        ByteUtils.U32.pack_into(out, 0, merge_count)
+        offset = 4
+
+        # Interleave the three merge columns and copy them in one go
+        entries = array('H', bytes(6 * merge_count))
+        entries[0::3] = merge_left
+        entries[1::3] = merge_right
+        entries[2::3] = merge_ids
+        if sys.byteorder == 'big':
+            entries.byteswap()
+        out[offset:offset + 6 * merge_count] = entries.tobytes()
+        offset += 6 * merge_count
+
+        ByteUtils.U32.pack_into(out, offset, len(tokens))
+        offset += 4
+        token_array = array('H', tokens)
+        if sys.byteorder == 'big':
+            token_array.byteswap()
+        out[offset:] = token_array.tobytes()
+
+        # every element of a bytearray is already < 256; latin-1 maps them 1:1
+        return out.decode("latin-1")
 
     def decompress_from_string(self, compressed_string: Optional[str] = None) -> str:
+        if not compressed_string:
+            return ""  # compress_to_string writes nothing for an empty document
+
         data = bytearray(compressed_string.encode("latin-1"))
         offset = 0
         try:
@@ -607,18 +832,16 @@ class XMLController:
             merge_count = ByteUtils.unpack_u32(data, offset)
             offset += 4
 
-            # Store merges in creation order
-            merges = []
-            for _ in range(merge_count):
-                if len(data) < offset + 6:
-                    raise ValueError("Compressed data too short to read merge tuple.")
-                t1 = ByteUtils.unpack_u16(data, offset)
-                offset += 2
-                t2 = ByteUtils.unpack_u16(data, offset)
-                offset += 2
-                merged = ByteUtils.unpack_u16(data, offset)
-                offset += 2
-                merges.append((merged, t1, t2))
+            # Store merges in creation order, one array per column
+            if len(data) < offset + 6 * merge_count:
+                raise ValueError("Compressed data too short to read merge tuple.")
+            entries = array('H', data[offset:offset + 6 * merge_count])
+            if sys.byteorder == 'big':
+                entries.byteswap()
+            merge_left = entries[0::3]
+            merge_right = entries[1::3]
+            merge_ids = entries[2::3]
+            offset += 6 * merge_count
 
             # Check for at least 4 bytes for token_count
             if len(data) < offset + 4:
@@ -626,24 +849,41 @@ class XMLController:
             token_count = ByteUtils.unpack_u32(data, offset)
             offset += 4
 
-            tokens = []
-            for _ in range(token_count):
-                if len(data) < offset + 2:
-                    raise ValueError("Compressed data too short to read token value.")
-                tokens.append(ByteUtils.unpack_u16(data, offset))
-                offset += 2
-
-            # Expand in REVERSE creation order
-            for merged_token, t1, t2 in reversed(merges):
-                new_tokens = []
-                for t in tokens:
-                    if t == merged_token:
-                        new_tokens.append(t1)
-                        new_tokens.append(t2)
-                    else:
-                        new_tokens.append(t)
-                tokens = new_tokens
+            if len(data) < offset + 2 * token_count:
+                raise ValueError("Compressed data too short to read token value.")
+            tokens = array('H', data[offset:offset + 2 * token_count])
+            if sys.byteorder == 'big':
+                tokens.byteswap()
+            offset += 2 * token_count
+
+            # Expand in REVERSE creation order: the parts of merge k are only
+            # expanded further by merges made before it. Each token is walked
+            # depth-first with that limit, so every output character is
+            # produced once instead of rebuilding the stream per merge.
+            definitions = {}  # merged id -> merge indexes defining it, ascending
+            for k in range(merge_count):
+                definitions.setdefault(merge_ids[k], []).append(k)
+
+            chars = []
+            stack = []
+            for token in reversed(tokens):
+                stack.append((token, merge_count))
+            while stack:
+                t, limit = stack.pop()
+                ks = definitions.get(t)
+                if ks is not None and ks[0] < limit:
+                    # latest merge defining t that is still allowed (ids are
+                    # normally unique, so this is almost always ks[-1])
+                    k = ks[-1] if ks[-1] < limit else ks[bisect_left(ks, limit) - 1]
+                    stack.append((merge_right[k], k))
+                    stack.append((merge_left[k], k))
+                else:
+                    chars.append(t)
 
-            return ''.join(chr(t) for t in tokens)
+            text = ''.join(map(chr, chars))
+            if _SURROGATE_RE.search(text):
+                # rejoin the surrogate pairs written for characters beyond the BMP
+                text = text.encode('utf-16-le', 'surrogatepass').decode('utf-16-le', 'surrogatepass')
+            return text
         except Exception as e:
             raise ValueError(f"{e}")
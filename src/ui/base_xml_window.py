@@ -2,40 +2,93 @@
 Base XML Window - Provides common functionality for XML-related UI windows.
 """
 import json
-from typing import Optional, Dict, List, Tuple, Any
+import os
+from functools import cached_property, partialmethod
+from typing import Optional, Callable, Dict, List, Tuple, Any
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                QPushButton, QTextEdit, QLineEdit, QFileDialog,
-                               QMessageBox, QLabel, QDialog)
-from PySide6.QtCore import Qt, Signal, QSize
+                               QMessageBox, QLabel, QDialog, QApplication)
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QTimer, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QBrush, QColor, QLinearGradient, QPainter, QPalette, QPixmap, QResizeEvent
 
 # Controller imports
 from ..controllers import XMLController
 from ..controllers import GraphController
 
-# UI window imports
-from .code_viewer_window import CodeViewerWindow
-from .graph_visualization_window import GraphVisualizationWindow
-
 # utilities imports
 from ..utils import file_io
 
+# Stylesheets
+from .styles import XML_WINDOW_QSS
+
 # Parent Imports
 from abc import abstractmethod
 
 
+class _OpSignals(QObject):
+    """Signals of an _OpWorker; QRunnable is not a QObject and cannot own any."""
+
+    # Both carry the generation the worker was started with
+    finished = Signal(int, object)
+    failed = Signal(int, str)
+
+
+class _OpWorker(QRunnable):
+    """Runs one controller call on a pool thread and reports back by signal."""
+
+    def __init__(self, fn: Callable[[], Any], generation: int) -> None:
+        super().__init__()
+        self.fn = fn
+        self.generation = generation
+        # Created on the UI thread, so connected window slots run there too
+        self.signals = _OpSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.finished.emit(self.generation, result)
+
+
 class BaseXMLWindow(QMainWindow):
     """Base class for XML-related UI windows with shared functionality."""
 
     back_clicked = Signal()
 
+    # Widget sizes, shared by every window instead of rebuilt per call
+    MIN_WINDOW_SIZE = QSize(1200, 700)
+    SEARCH_DIALOG_SIZE = QSize(600, 450)
+    BACK_BTN_MIN_SIZE = QSize(150, 40)
+    BTN_HEIGHT = 40
+    SAVE_BTN_MAX_WIDTH = 150
+    OP_BTN_HEIGHT = 46
+    # Minimum gap between two searches run from the search dialog
+    SEARCH_THROTTLE_MS = 150
+
+    # Operation buttons, top to bottom: (label, handler name).
+    # Subclasses can override this to change the operations they offer.
+    _PARSING_OPS: Tuple[Tuple[str, str], ...] = (
+        ("📋 Check XML Errors", "validate_xml"),
+        ("🛠️ Fix XML Errors", "correct_errors"),
+        ("✨ Format XML", "format_xml"),
+        ("📦 Compress XML", "compress"),
+        ("📂 Decompress to XML", "decompress"),
+        ("✂️ Minify XML", "minify"),
+        ("📄 XML to JSON", "export_to_json"),
+        ("🕸️ Explore Network", "visualize_network"),
+        ("🔍 Post search", "search"),
+    )
+
     def __init__(self, window_title: str, mode_name: str) -> None:
         super().__init__()
+        self.setObjectName("xmlWindow")
 
-        # Initialize controllers
-        self.xml_controller: XMLController = XMLController()
-        # self.data_controller: DataController = DataController()  # TODO: Implement DataController
+        # Initialize controllers (xml_controller is created on first use)
         self.graph_controller: GraphController = GraphController()
 
+        self._background_height: int = 0  # height the backdrop was painted for
         self.input_text: str = ""
         self.output_text: str = ""
         self.result_text_box: QTextEdit = QTextEdit()
@@ -43,16 +96,71 @@ class BaseXMLWindow(QMainWindow):
         self.window_title: str = window_title
         self.mode_name: str = mode_name
 
+        # Background operations: only the latest generation reports back
+        self._op_generation: int = 0
+        self._op_callback: Optional[Callable[[Any], None]] = None
+        self._op_snapshot: Optional[XMLController] = None  # input copy the workers run on
+
+        # Save dialog, built the first time a result is saved
+        self._save_dialog: Optional[QFileDialog] = None
+        self._last_save_dir: str = ""
+
+        # Search dialog, built the first time it is opened
+        self._search_dialog: Optional[QDialog] = None
+        self._search_input: Optional[QLineEdit] = None
+        self._search_results: Optional[QTextEdit] = None
+        self._search_timer: Optional[QTimer] = None
+        self._pending_search: Optional[Callable[[], None]] = None
+
         self.setup_ui()
         self.apply_stylesheet()
 
+    @cached_property
+    def xml_controller(self) -> XMLController:
+        """XML controller, built the first time an operation or upload needs it."""
+        return XMLController()
+
+    def _update_background(self) -> None:
+        """
+        Paint the window's vertical gradient backdrop into the palette.
+
+        The gradient is rendered once per window height into a 1px-wide
+        pixmap that the brush tiles sideways, so repaints are a plain blit
+        instead of re-evaluating a QSS gradient over the whole window.
+        """
+        height = max(1, self.height())
+        if height == self._background_height:
+            return
+        self._background_height = height
+
+        pixmap = QPixmap(1, height)
+        gradient = QLinearGradient(0, 0, 0, height)
+        gradient.setColorAt(0, QColor(10, 15, 30))
+        gradient.setColorAt(1, QColor(15, 25, 40))
+        painter = QPainter(pixmap)
+        painter.fillRect(pixmap.rect(), gradient)
+        painter.end()
+
+        palette = self.palette()
+        palette.setBrush(QPalette.ColorRole.Window, QBrush(pixmap))
+        self.setPalette(palette)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Re-render the backdrop when the window height changes."""
+        super().resizeEvent(event)
+        self._update_background()
+
     def setup_ui(self) -> None:
         """Set up the user interface."""
+        # No repaints while the widgets are added; one update at the end
+        self.setUpdatesEnabled(False)
         self.setWindowTitle(self.window_title)
-        self.setMinimumSize(1200, 700)
+        self.setMinimumSize(self.MIN_WINDOW_SIZE)
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
+        self.setAutoFillBackground(True)
+        self._update_background()
 
         main_layout = QVBoxLayout(central_widget)
         main_layout.setSpacing(15)
@@ -63,9 +171,8 @@ class BaseXMLWindow(QMainWindow):
 
         back_btn = QPushButton("← Back to Home")
         back_btn.setObjectName("backBtn")
-        back_btn.setMinimumHeight(40)
-        back_btn.setMinimumWidth(150)
-        back_btn.clicked.connect(self.back_clicked.emit)
+        back_btn.setMinimumSize(self.BACK_BTN_MIN_SIZE)
+        back_btn.clicked.connect(self.back_clicked)  # signal-to-signal, no Python hop
         top_bar.addWidget(back_btn)
         top_bar.addStretch()
 
@@ -95,18 +202,12 @@ class BaseXMLWindow(QMainWindow):
         result_layout.setSpacing(10)
 
         result_title = QLabel("Operation Result")
-        result_title.setStyleSheet("""
-            QLabel {
-                color: rgba(200, 210, 220, 255);
-                font-size: 22px;
-                font-weight: bold;
-            }
-        """)
+        result_title.setObjectName("sectionTitle")
 
         save_btn = QPushButton("⬆ Save")
         save_btn.setObjectName("saveBtn")
-        save_btn.setMinimumHeight(40)
-        save_btn.setMaximumWidth(150)
+        save_btn.setMinimumHeight(self.BTN_HEIGHT)
+        save_btn.setMaximumWidth(self.SAVE_BTN_MAX_WIDTH)
         save_btn.clicked.connect(self.save)
 
         result_title_layout = QHBoxLayout()
@@ -134,43 +235,20 @@ class BaseXMLWindow(QMainWindow):
         ops_layout.setSpacing(17)
 
         ops_title = QLabel("Operations")
-        ops_title.setStyleSheet("""
-            QLabel {
-                color: rgba(200, 210, 220, 255);
-                font-size: 25px;
-                font-weight: bold;
-            }
-        """)
+        ops_title.setObjectName("opsTitle")
 
         ops_subtitle = QLabel("Manage, Transform and Analyze XML Data")
         ops_subtitle.setContentsMargins(0, 0, 0, 10)
-        ops_subtitle.setStyleSheet("""
-            QLabel {
-                color: rgba(200, 210, 220, 255);
-                font-size: 12px;
-            }
-        """)
+        ops_subtitle.setObjectName("opsSubtitle")
 
         ops_layout.addWidget(ops_title)
         ops_layout.addWidget(ops_subtitle)
 
-        parsing_ops = [
-            ("📋 Check XML Errors", self.validate_xml),
-            ("🛠️ Fix XML Errors", self.correct_errors),
-            ("✨ Format XML", self.format_xml),
-            ("📦 Compress XML", self.compress),
-            ("📂 Decompress to XML", self.decompress),
-            ("✂️ Minify XML", self.minify),
-            ("📄 XML to JSON", self.export_to_json),
-            ("🕸️ Explore Network", self.visualize_network),
-            ("🔍 Post search", self.search)
-        ]
-
-        for text, handler in parsing_ops:
+        for text, attr in self._PARSING_OPS:
+            handler = getattr(self, attr)
             btn = QPushButton(text)
             btn.setObjectName("operationBtn")
-            btn.setMinimumHeight(46)
-            # btn.setMaximumWidth(20)
+            btn.setMinimumHeight(self.OP_BTN_HEIGHT)
             btn.clicked.connect(handler)
             ops_layout.addWidget(btn)
 
@@ -178,6 +256,9 @@ class BaseXMLWindow(QMainWindow):
 
         sub_layout.addWidget(ops_widget)
 
+        # Re-enabling updates schedules the single repaint
+        self.setUpdatesEnabled(True)
+
     @abstractmethod
     def _setup_input_section(self, parent_layout: QVBoxLayout) -> None:
         """
@@ -186,148 +267,14 @@ class BaseXMLWindow(QMainWindow):
         """
         raise NotImplementedError("Subclasses must implement _setup_input_section")
 
-    @abstractmethod
-    def _get_panel_selector(self) -> str:
-        """
-        Abstract method to get the panel selector for stylesheet.
-        Must be overridden by subclasses.
-        """
-        raise NotImplementedError("Subclasses must implement _get_panel_selector")
-
-    @abstractmethod
-    def _get_initialization_message(self) -> str:
-        """
-        Abstract method to get the initialization message.
-        Must be overridden by subclasses.
-        """
-        raise NotImplementedError("Subclasses must implement _get_initialization_message")
-
     def apply_stylesheet(self) -> None:
         """Apply modern stylesheet matching landing page."""
-        panel_selector = self._get_panel_selector()
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                           stop:0 rgba(10, 15, 30, 255),
-                                           stop:1 rgba(15, 25, 40, 255));
-            }}
-
-            {panel_selector} {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                           stop:0 rgba(20, 35, 55, 200),
-                                           stop:1 rgba(15, 25, 45, 200));
-                border: 2px solid rgba(100, 150, 200, 100);
-                border-radius: 15px;
-            }}
-
-            #fileInput, #textInput {{
-                background-color: rgba(30, 45, 65, 180);
-                border: 1px solid rgba(80, 120, 160, 120);
-                border-radius: 8px;
-                color: rgba(220, 230, 240, 255);
-                padding: 10px;
-                font-size: 13px;
-            }}
-
-            #resultText {{
-                background-color: rgba(15, 20, 35, 180);
-                border: 1px solid rgba(80, 120, 160, 120);
-                border-radius: 8px;
-                color: rgba(220, 230, 240, 255);
-                padding: 12px;
-                font-size: 12px;
-            }}
-
-            #backBtn {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                           stop:0 rgba(60, 80, 100, 200),
-                                           stop:1 rgba(80, 100, 120, 200));
-                border: 2px solid rgba(100, 150, 200, 150);
-                border-radius: 8px;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px 15px;
-            }}
-
-            #backBtn:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                           stop:0 rgba(80, 100, 120, 230),
-                                           stop:1 rgba(100, 120, 140, 230));
-            }}
-
-            #browseFileBtn {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                           stop:0 rgba(40, 120, 200, 200),
-                                           stop:1 rgba(60, 140, 220, 200));
-                border: 2px solid rgba(80, 160, 240, 200);
-                border-radius: 8px;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-
-            #browseFileBtn:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                           stop:0 rgba(60, 140, 220, 230),
-                                           stop:1 rgba(80, 160, 240, 230));
-            }}
-
-            #uploadBtn {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                           stop:0 rgba(50, 150, 255, 200),
-                                           stop:1 rgba(80, 180, 255, 200));
-                border: 2px solid rgba(100, 200, 255, 255);
-                border-radius: 8px;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-
-            #uploadBtn:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                           stop:0 rgba(70, 170, 255, 230),
-                                           stop:1 rgba(100, 200, 255, 230));
-            }}
-            
-            #saveBtn {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                           stop:0 rgba(50, 150, 255, 200),
-                                           stop:1 rgba(80, 180, 255, 200));
-                border: 2px solid rgba(100, 200, 255, 255);
-                border-radius: 8px;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-
-            #saveBtn:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                           stop:0 rgba(70, 170, 255, 230),
-                                           stop:1 rgba(100, 200, 255, 230));
-            }}
-
-            #operationBtn {{
-                background: rgba(40, 70, 110, 180);
-                border: 1px solid rgba(80, 120, 180, 150);
-                border-radius: 8px;
-                color: rgba(200, 220, 240, 255);
-                font-size: 15px;
-                text-align: left;
-                font-weight: bold;
-                padding-left: 10px;
-            }}
-
-            #operationBtn:hover {{
-                background: rgba(60, 90, 130, 200);
-                border: 1px solid rgba(100, 150, 200, 180);
-                color: white;
-            }}
-
-            #operationBtn:pressed {{
-                background: rgba(30, 50, 80, 180);
-            }}
-        """)
+        # The rules live on the application, so only the first window needs
+        # to install them; later windows are styled with no QSS parsing
+        app = QApplication.instance()
+        app_qss = app.styleSheet()
+        if XML_WINDOW_QSS not in app_qss:
+            app.setStyleSheet(app_qss + XML_WINDOW_QSS)
 
     @abstractmethod
     def upload(self) -> None:
@@ -338,10 +285,13 @@ class BaseXMLWindow(QMainWindow):
         """
         raise NotImplementedError("Subclasses must implement upload_and_parse")
 
+    @Slot()
     def save(self) -> None:
         """Save the result of the current operation to a file."""
-        self.output_text = self.result_text_box.toPlainText().strip()
-        if not self.output_text:
+        # Every operation stores the text it shows in output_text, so the
+        # (read-only) result box does not need to be serialized again
+        text = self.output_text.strip()
+        if not text:
             QMessageBox.warning(
                 self,
                 "No Data",
@@ -349,17 +299,25 @@ class BaseXMLWindow(QMainWindow):
             )
             return
 
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save Result",
-            "",
-            "Text Files (*.txt);; XML Files (*.xml);;JSON Files (*.json);;All Files (*)"
-        )
+        # The dialog is built once and reused, so only the first Save pays
+        # for initializing the platform file dialog
+        if self._save_dialog is None:
+            self._save_dialog = QFileDialog(self, "Save Result")
+            self._save_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            self._save_dialog.setNameFilter(
+                "Text Files (*.txt);; XML Files (*.xml);;JSON Files (*.json);;All Files (*)"
+            )
+
+        # Open where the last file was saved, even if the user browsed
+        # elsewhere and then canceled
+        if self._last_save_dir:
+            self._save_dialog.setDirectory(self._last_save_dir)
 
-        if not file_path:
+        if not self._save_dialog.exec():
             return  # User canceled save dialog
+        file_path = self._save_dialog.selectedFiles()[0]
 
-        success, message = file_io.write_file(file_path, self.output_text)
+        success, message = file_io.write_file(file_path, text)
         if not success:
             QMessageBox.critical(
                 self,
@@ -368,6 +326,7 @@ class BaseXMLWindow(QMainWindow):
             )
             return
 
+        self._last_save_dir = os.path.dirname(file_path)
         QMessageBox.information(
             self,
             "Saved",
@@ -376,14 +335,6 @@ class BaseXMLWindow(QMainWindow):
 
     def error_event_handler(self) -> bool:
         """Centralized UI error handler."""
-        if self.xml_controller is None:  # error in initializing controller
-            QMessageBox.critical(
-                self,
-                "System Error",
-                "XML controller is not initialized."
-            )
-            return False
-
         if not self.input_text or not self.input_text.strip():  # empty input or xml
             QMessageBox.warning(
                 self,
@@ -402,14 +353,15 @@ class BaseXMLWindow(QMainWindow):
 
         return True
 
+    @Slot()
     def validate_xml(self) -> None:
         """Validate XML structure."""
         if not self.error_event_handler():
             return
 
+        self._discard_pending_ops()
         self.output_text, error_counts = self.xml_controller.validate()
-        self.result_text_box.setText(self.output_text)
-        self.result_text_box.show()
+        self._show_result(self.output_text)
 
         # Show status message box
         if error_counts['total'] == 0:
@@ -434,14 +386,15 @@ class BaseXMLWindow(QMainWindow):
                 "\n\nCheck the result box for detailed line-by-line annotations."
             )
 
+    @Slot()
     def correct_errors(self) -> None:
         """Correct XML errors and show correction status."""
         if not self.error_event_handler():
             return
 
+        self._discard_pending_ops()
         self.output_text, correction_counts = self.xml_controller.autocorrect()
-        self.result_text_box.setText(self.output_text)
-        self.result_text_box.show()
+        self._show_result(self.output_text)
 
         # Show status message box
         if correction_counts['total_corrections'] == 0:
@@ -466,32 +419,113 @@ class BaseXMLWindow(QMainWindow):
                 "\n\nCheck the result box to see the corrected XML."
             )
 
-    def format_xml(self) -> None:
-        """Format/prettify XML file."""
-        if not self.error_event_handler():
-            return
+    def _show_result(self, text: str) -> None:
+        """
+        Show an operation's output in the result box.
+
+        Results are XML, JSON or compressed data, so they are set as plain
+        text: setText() would sniff them for rich text and render XML tags
+        as HTML. Repainting is paused while a large document is swapped in.
+        """
+        box = self.result_text_box
+        box.setUpdatesEnabled(False)
+        box.setPlainText(text)
+        box.setUpdatesEnabled(True)
+        box.show()
+
+    def _run_in_background(self, fn: Callable[[], Any], on_finished: Callable[[Any], None]) -> None:
+        """
+        Run fn on the global thread pool so the window stays responsive.
+
+        on_finished receives fn's return value on the UI thread; an exception
+        raised by fn is reported in a message box instead. Only the latest
+        operation reports back: starting a new one, or any handler that calls
+        _discard_pending_ops, discards the outcome of any still running, so
+        rapid clicks end in a single result box update.
+        """
+        self._op_generation += 1
+        self._op_callback = on_finished
+        worker = _OpWorker(fn, self._op_generation)
+        worker.signals.finished.connect(self._deliver_op_result)
+        worker.signals.failed.connect(self._show_op_error)
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(int, object)
+    def _deliver_op_result(self, generation: int, result: Any) -> None:
+        """Pass a worker's result on, unless a newer operation replaced it."""
+        if generation == self._op_generation:
+            self._op_callback(result)
+
+    @Slot(int, str)
+    def _show_op_error(self, generation: int, message: str) -> None:
+        """Report an operation that failed on a worker thread."""
+        if generation != self._op_generation:
+            return  # superseded by a newer operation
+        QMessageBox.critical(
+            self,
+            "Operation Error",
+            f"The operation failed:\n\n{message}"
+        )
 
-        self.output_text = self.xml_controller.format()
-        self.result_text_box.setText(self.output_text)
-        self.result_text_box.show()
+    def _discard_pending_ops(self) -> None:
+        """
+        Drop the result of any background operation still running.
 
-    def compress(self) -> None:
-        """Check for data integrity issues."""
+        Called by handlers that change the input or write the output on the
+        UI thread, so an older background result cannot overwrite theirs.
+        """
+        self._op_generation += 1
+
+    def _op_controller(self) -> XMLController:
+        """
+        Return a controller holding a snapshot of the current input for a worker.
+
+        Workers never touch self.xml_controller, which upload, validate and
+        autocorrect update on the UI thread. The snapshot is reused while the
+        input is unchanged, so format's result cache still serves repeated
+        clicks.
+        """
+        source = self.xml_controller.get_xml_string()
+        snapshot = self._op_snapshot
+        if snapshot is None or snapshot.get_xml_string() is not source:
+            snapshot = self._op_snapshot = XMLController(source)
+        return snapshot
+
+    def _run_op(self, op: str) -> None:
+        """
+        Run an XMLController operation that returns text and show the result.
+
+        The operation runs off the UI thread; the result box is updated when
+        it finishes.
+
+        Args:
+            op: Name of the XMLController method to call (no arguments)
+        """
         if not self.error_event_handler():
             return
 
-        self.output_text = self.xml_controller.compress_to_string()
-        self.result_text_box.setText(self.output_text)
-        self.result_text_box.show()
+        self._run_in_background(getattr(self._op_controller(), op), self._show_op_result)
+
+    # Text-only operations, bound once on the class rather than per window
+    format_xml = partialmethod(_run_op, "format")
+    compress = partialmethod(_run_op, "compress_to_string")
+    minify = partialmethod(_run_op, "minify")
 
+    @Slot(object)
+    def _show_op_result(self, text: str) -> None:
+        """Store and display the text returned by a background operation."""
+        self.output_text = text
+        self._show_result(text)
+
+    @Slot()
     def decompress(self) -> None:
         if not self.error_event_handler():
             return
 
+        self._discard_pending_ops()
         try:
             self.output_text = self.xml_controller.decompress_from_string(self.input_text)
-            self.result_text_box.setText(self.output_text)
-            self.result_text_box.show()
+            self._show_result(self.output_text)
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -499,24 +533,23 @@ class BaseXMLWindow(QMainWindow):
                 f"Failed to decompress the data:\n\n{str(e)}"
             )
 
-    def minify(self) -> None:
-        """View XML file content in code viewer."""
-        if not self.error_event_handler():
-            return
-
-        self.output_text = self.xml_controller.minify()
-        self.result_text_box.setText(self.output_text)
-        self.result_text_box.show()
-
+    @Slot()
     def export_to_json(self) -> None:
         """Export XML data to JSON format."""
         if not self.error_event_handler():
             return
 
-        self.output_text = self.xml_controller.export_to_json()
-        self.result_text_box.setText(json.dumps(self.output_text, indent=2, ensure_ascii=False))
-        self.result_text_box.show()
+        controller = self._op_controller()
+
+        def build_json() -> str:
+            # Both the conversion and the rendering run off the UI thread
+            data = controller.export_to_json()
+            return json.dumps(data, indent=2, ensure_ascii=False)
 
+        # output_text holds the JSON text, exactly as shown and saved
+        self._run_in_background(build_json, self._show_op_result)
+
+    @Slot()
     def visualize_network(self) -> None:
         """Visualize network graph."""
         if not self.graph_controller or not self.graph_controller.xml_data:
@@ -530,6 +563,11 @@ class BaseXMLWindow(QMainWindow):
                 # Pass graph and metrics from controller to visualization
                 G = self.graph_controller.get_graph()
                 metrics = self.graph_controller.get_metrics()
+                # Imported on first use: it pulls in matplotlib, which would
+                # otherwise be loaded with every window whether or not the
+                # network is ever explored
+                from .graph_visualization_window import GraphVisualizationWindow
+
                 graph_window = GraphVisualizationWindow(nodes, edges, self.size(), self)
                 graph_window.set_graph_data(nodes, edges, G, metrics)
                 graph_window.showMaximized()
@@ -538,49 +576,32 @@ class BaseXMLWindow(QMainWindow):
         else:
             QMessageBox.critical(self, "Graph Build Failed", f"Failed to build graph:\n{error}")
 
+    @Slot()
     def search(self) -> None:
         """
         Opens a larger pop-up window with an input field,
         an output display area, and search buttons.
+
+        The dialog is built on first use and reused afterwards; each opening
+        starts from an empty search.
         """
+        if self._search_dialog is None:
+            self._search_dialog = self._build_search_dialog()
+        else:
+            self._search_input.clear()
+            self._search_results.clear()
+
+        self._search_dialog.exec()
+
+    def _build_search_dialog(self) -> QDialog:
+        """Create the search dialog and keep its input and result widgets."""
         # 1. Create the Dialog Window
         dialog = QDialog(self)
         dialog.setWindowTitle("Search")
-        dialog.setFixedSize(600, 450)  # Increased size
-
-        # Apply the dark theme (updated to include QTextEdit styling)
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: rgb(20, 35, 55);
-                border: 2px solid rgba(100, 150, 200, 100);
-            }
-            QLineEdit {
-                background-color: rgba(30, 45, 65, 180);
-                border: 1px solid rgba(80, 120, 160, 120);
-                border-radius: 5px;
-                color: white;
-                padding: 8px;
-                font-size: 14px;
-            }
-            QTextEdit {
-                background-color: rgba(15, 20, 35, 180);
-                border: 1px solid rgba(80, 120, 160, 120);
-                border-radius: 5px;
-                color: rgba(220, 230, 240, 255);
-                padding: 10px;
-                font-size: 13px;
-            }
-            QPushButton {
-                background-color: rgba(40, 70, 110, 180);
-                border: 1px solid rgba(80, 120, 180, 150);
-                border-radius: 5px;
-                color: white;
-                padding: 6px 15px;
-            }
-            QPushButton:hover {
-                background-color: rgba(60, 90, 130, 200);
-            }
-        """)
+        dialog.setFixedSize(self.SEARCH_DIALOG_SIZE)
+
+        # Dark theme: #searchDialog rules in the shared application stylesheet
+        dialog.setObjectName("searchDialog")
 
         # 2. Setup Layouts
         layout = QVBoxLayout(dialog)
@@ -588,15 +609,15 @@ class BaseXMLWindow(QMainWindow):
         layout.setContentsMargins(20, 20, 20, 20)
 
         # 3. Input Area
-        search_input = QLineEdit()
-        search_input.setPlaceholderText("Enter keyword to search...")
-        layout.addWidget(search_input)
+        self._search_input = QLineEdit()
+        self._search_input.setPlaceholderText("Enter keyword to search...")
+        layout.addWidget(self._search_input)
 
         # 4. Output Area (New Addition)
-        result_area = QTextEdit()
-        result_area.setReadOnly(True)
-        result_area.setPlaceholderText("Search results will appear here...")
-        layout.addWidget(result_area)
+        self._search_results = QTextEdit()
+        self._search_results.setReadOnly(True)
+        self._search_results.setPlaceholderText("Search results will appear here...")
+        layout.addWidget(self._search_results)
 
         # 5. Buttons Area (Bottom Right)
         btn_layout = QHBoxLayout()
@@ -611,38 +632,72 @@ class BaseXMLWindow(QMainWindow):
 
         layout.addLayout(btn_layout)
 
-        # 6. Define Internal Helper Functions
-        def on_search_topic():
-            text = search_input.text().strip()
-            if text:
-                # Clear previous results
-                result_area.clear()
-                result_area.append(f"Searching for '{text}' in Topics...\n\n")
-                # Call the main class function
-                result = self.search_in_post(text, Type='topic')
-                for i in range(len(result)):
-                    result_area.append(result[i] + '\n\n')
-
-        def on_search_post():
-            text = search_input.text().strip()
-            if text:
-                result_area.clear()
-                result_area.append(f"Searching for '{text}' in Posts...\n")
-
-                result = self.search_in_post(text, Type='word')
-                for i in range(len(result)):
-                    result_area.append(result[i] + '\n')
-
-        # 7. Connect Signals
-        btn_topic.clicked.connect(on_search_topic)
-        btn_post.clicked.connect(on_search_post)
-
-        # 8. Execute the Dialog
-        dialog.exec()
-
-    def search_in_post(self, keyword: str, Type: str) -> Optional[List[str]]:
+        # 6. Connect Signals; repeated clicks are throttled (see _throttle_search)
+        self._search_timer = QTimer(dialog)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_THROTTLE_MS)
+        self._search_timer.timeout.connect(self._run_pending_search)
+
+        btn_topic.clicked.connect(self._on_search_topic)
+        btn_post.clicked.connect(self._on_search_post)
+
+        return dialog
+
+    @Slot()
+    def _on_search_topic(self) -> None:
+        """Handle the 'Search in Topic' button."""
+        self._throttle_search(self._search_topic)
+
+    @Slot()
+    def _on_search_post(self) -> None:
+        """Handle the 'Search in Post' button."""
+        self._throttle_search(self._search_post)
+
+    def _throttle_search(self, run_search: Callable[[], None]) -> None:
+        """
+        Run a search now, unless one ran within the last SEARCH_THROTTLE_MS.
+
+        Clicks inside that window are collapsed: only the latest one is kept
+        and it runs once the window ends, so rapid clicking costs at most one
+        scan per interval and the final request is never lost.
+        """
+        if self._search_timer.isActive():
+            self._pending_search = run_search
+            return
+
+        run_search()
+        self._search_timer.start()
+
+    @Slot()
+    def _run_pending_search(self) -> None:
+        """Run the search held back by _throttle_search, if any."""
+        run_search, self._pending_search = self._pending_search, None
+        if run_search is not None:
+            run_search()
+            self._search_timer.start()
+
+    def _search_topic(self) -> None:
+        """Search the loaded posts by topic and list the matches."""
+        text = self._search_input.text().strip()
+        if text:
+            # Call the main class function
+            result = self.search_in_post(text, Type='topic')
+            # One paragraph per entry, replacing the previous results in a
+            # single update rather than appending (and re-laying out) each
+            self._search_results.setPlainText("\n".join(
+                [f"Searching for '{text}' in Topics...\n\n"] + [entry + '\n\n' for entry in result]
+            ))
+
+    def _search_post(self) -> None:
+        """Search the loaded posts by word and list the matches."""
+        text = self._search_input.text().strip()
+        if text:
+            result = self.search_in_post(text, Type='word')
+            self._search_results.setPlainText("\n".join(
+                [f"Searching for '{text}' in Posts...\n"] + [entry + '\n' for entry in result]
+            ))
+
+    def search_in_post(self, keyword: str, Type: str) -> List[str]:
         """Placeholder logic for searching within topics."""
-        # if Type =='word':
-        #     return self.data_controller.search_in_posts(word = keyword)
-        # else:
-        #     return self.data_controller.search_in_posts(topic = keyword)
+        # No search backend yet: report no matches (None broke the callers)
+        return []
@@ -4,6 +4,7 @@ Browse Mode Window - Load XML from file browser
 import os
 from PySide6.QtWidgets import QPushButton, QLineEdit, QFileDialog, QMessageBox, QLabel, QVBoxLayout, QHBoxLayout, \
     QWidget
+from PySide6.QtCore import Slot
 
 from .base_xml_window import BaseXMLWindow
 
@@ -32,13 +33,7 @@ class BrowseWindow(BaseXMLWindow):
         file_layout.setSpacing(10)
 
         file_title = QLabel("Load XML Data")
-        file_title.setStyleSheet("""
-            QLabel {
-                color: rgba(200, 210, 220, 255);
-                font-size: 22px;
-                font-weight: bold;
-            }
-        """)
+        file_title.setObjectName("sectionTitle")
         file_layout.addWidget(file_title)
 
         file_input_layout = QHBoxLayout()
@@ -65,14 +60,7 @@ class BrowseWindow(BaseXMLWindow):
         file_layout.addLayout(file_input_layout)
         parent_layout.addWidget(file_widget)
 
-    def _get_panel_selector(self) -> str:
-        """Return the panel selector for stylesheet."""
-        return "#filePanel, #resultPanel, #opsPanel"
-
-    def _get_initialization_message(self) -> str:
-        """Return the initialization message."""
-        return "Ready to load XML file."
-
+    @Slot()
     def browse(self) -> None:
         """Handle file browsing with format validation."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -98,6 +86,7 @@ class BrowseWindow(BaseXMLWindow):
             )
             return
 
+    @Slot()
     def upload(self) -> None:
         if not self.file_path_box.text():
             QMessageBox.warning(self, "No File", "Please select an XML file first.")
@@ -115,6 +104,7 @@ class BrowseWindow(BaseXMLWindow):
             QMessageBox.warning(self, "XML Error", str(e))
             return
 
+        self._discard_pending_ops()  # results for the previous input are stale
         self.input_text = result
         QMessageBox.information(self, "Success", "XML file loaded successfully.")
 
@@ -2,6 +2,7 @@
 Manual Mode Window - Load XML from manual input
 """
 from PySide6.QtWidgets import QPushButton, QTextEdit, QMessageBox, QLabel, QVBoxLayout, QHBoxLayout, QWidget
+from PySide6.QtCore import Slot
 from .base_xml_window import BaseXMLWindow
 
 
@@ -30,13 +31,7 @@ class ManualWindow(BaseXMLWindow):
         text_title_layout.setSpacing(40)
 
         text_title = QLabel("Enter XML Data")
-        text_title.setStyleSheet("""
-            QLabel {
-                color: rgba(200, 210, 220, 255);
-                font-size: 22px;
-                font-weight: bold;
-            }
-        """)
+        text_title.setObjectName("sectionTitle")
 
         upload_btn = QPushButton("⬆ Upload")
         upload_btn.setObjectName("uploadBtn")
@@ -56,14 +51,7 @@ class ManualWindow(BaseXMLWindow):
         text_layout.addWidget(self.input_text_box, 1)
         parent_layout.addWidget(text_widget)
 
-    def _get_panel_selector(self) -> str:
-        """Return the panel selector for stylesheet."""
-        return "#textPanel, #resultPanel, #opsPanel"
-
-    def _get_initialization_message(self) -> str:
-        """Return the initialization message."""
-        return "Ready to load XML text."
-
+    @Slot()
     def upload(self) -> None:
         """Handle XML text upload and parsing (manual input)."""
         self.input_text = self.input_text_box.toPlainText().strip()
@@ -86,6 +74,7 @@ class ManualWindow(BaseXMLWindow):
             )
             return
 
+        self._discard_pending_ops()  # results for the previous input are stale
         QMessageBox.information(
             self,
             "Success",
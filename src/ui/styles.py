@@ -0,0 +1,179 @@
+"""
+Styles - Qt stylesheets shared by the UI windows.
+"""
+
+# Shared by every BaseXMLWindow and installed once on the application (see
+# BaseXMLWindow.apply_stylesheet) rather than parsed again for each window.
+# Rules only match the object names these windows use, so other windows are
+# unaffected. The window backdrop gradient is painted from a cached pixmap
+# instead (BaseXMLWindow._update_background).
+XML_WINDOW_QSS = """
+    #filePanel, #textPanel, #resultPanel, #opsPanel {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                   stop:0 rgba(20, 35, 55, 200),
+                                   stop:1 rgba(15, 25, 45, 200));
+        border: 2px solid rgba(100, 150, 200, 100);
+        border-radius: 15px;
+    }
+
+    #sectionTitle {
+        color: rgba(200, 210, 220, 255);
+        font-size: 22px;
+        font-weight: bold;
+    }
+
+    #opsTitle {
+        color: rgba(200, 210, 220, 255);
+        font-size: 25px;
+        font-weight: bold;
+    }
+
+    #opsSubtitle {
+        color: rgba(200, 210, 220, 255);
+        font-size: 12px;
+    }
+
+    #fileInput, #textInput {
+        background-color: rgba(30, 45, 65, 180);
+        border: 1px solid rgba(80, 120, 160, 120);
+        border-radius: 8px;
+        color: rgba(220, 230, 240, 255);
+        padding: 10px;
+        font-size: 13px;
+    }
+
+    #resultText {
+        background-color: rgba(15, 20, 35, 180);
+        border: 1px solid rgba(80, 120, 160, 120);
+        border-radius: 8px;
+        color: rgba(220, 230, 240, 255);
+        padding: 12px;
+        font-size: 12px;
+    }
+
+    #backBtn {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 rgba(60, 80, 100, 200),
+                                   stop:1 rgba(80, 100, 120, 200));
+        border: 2px solid rgba(100, 150, 200, 150);
+        border-radius: 8px;
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 8px 15px;
+    }
+
+    #backBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 rgba(80, 100, 120, 230),
+                                   stop:1 rgba(100, 120, 140, 230));
+    }
+
+    #browseFileBtn {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 rgba(40, 120, 200, 200),
+                                   stop:1 rgba(60, 140, 220, 200));
+        border: 2px solid rgba(80, 160, 240, 200);
+        border-radius: 8px;
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+    }
+
+    #browseFileBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 rgba(60, 140, 220, 230),
+                                   stop:1 rgba(80, 160, 240, 230));
+    }
+
+    #uploadBtn {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 rgba(50, 150, 255, 200),
+                                   stop:1 rgba(80, 180, 255, 200));
+        border: 2px solid rgba(100, 200, 255, 255);
+        border-radius: 8px;
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+    }
+
+    #uploadBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 rgba(70, 170, 255, 230),
+                                   stop:1 rgba(100, 200, 255, 230));
+    }
+
+    #saveBtn {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 rgba(50, 150, 255, 200),
+                                   stop:1 rgba(80, 180, 255, 200));
+        border: 2px solid rgba(100, 200, 255, 255);
+        border-radius: 8px;
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+    }
+
+    #saveBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                   stop:0 rgba(70, 170, 255, 230),
+                                   stop:1 rgba(100, 200, 255, 230));
+    }
+
+    #operationBtn {
+        background: rgba(40, 70, 110, 180);
+        border: 1px solid rgba(80, 120, 180, 150);
+        border-radius: 8px;
+        color: rgba(200, 220, 240, 255);
+        font-size: 15px;
+        text-align: left;
+        font-weight: bold;
+        padding-left: 10px;
+    }
+
+    #operationBtn:hover {
+        background: rgba(60, 90, 130, 200);
+        border: 1px solid rgba(100, 150, 200, 180);
+        color: white;
+    }
+
+    #operationBtn:pressed {
+        background: rgba(30, 50, 80, 180);
+    }
+
+    /* Search dialog (BaseXMLWindow.search) */
+    QDialog#searchDialog {
+        background-color: rgb(20, 35, 55);
+        border: 2px solid rgba(100, 150, 200, 100);
+    }
+
+    #searchDialog QLineEdit {
+        background-color: rgba(30, 45, 65, 180);
+        border: 1px solid rgba(80, 120, 160, 120);
+        border-radius: 5px;
+        color: white;
+        padding: 8px;
+        font-size: 14px;
+    }
+
+    #searchDialog QTextEdit {
+        background-color: rgba(15, 20, 35, 180);
+        border: 1px solid rgba(80, 120, 160, 120);
+        border-radius: 5px;
+        color: rgba(220, 230, 240, 255);
+        padding: 10px;
+        font-size: 13px;
+    }
+
+    #searchDialog QPushButton {
+        background-color: rgba(40, 70, 110, 180);
+        border: 1px solid rgba(80, 120, 180, 150);
+        border-radius: 5px;
+        color: white;
+        padding: 6px 15px;
+    }
+
+    #searchDialog QPushButton:hover {
+        background-color: rgba(60, 90, 130, 200);
+    }
+"""
@@ -5,19 +5,25 @@ Controllers should NOT touch disk operations directly.
 import re
 import pathlib
 from pathlib import Path
-from typing import Tuple, Union
+from typing import NamedTuple, Tuple, Union
 
 
-def read_file(path: str) -> Tuple[bool, str]:
+class FileRead(NamedTuple):
+    """Result of read_file; still unpacks as (ok, data)."""
+    ok: bool
+    data: str  # file content, or the error message when ok is False
+
+
+def read_file(path: str) -> FileRead:
     """
     Reads a file and returns (success, content or error message).
     This avoids exceptions leaking into controllers or CLI.
     """
     try:
         content = Path(path).read_text(encoding="utf-8")
-        return True, content
+        return FileRead(True, content)
     except Exception as e:
-        return False, str(e)
+        return FileRead(False, str(e))
 
 def pretty_format(xml: str, indent: str = "    ") -> str:
     """
@@ -28,6 +34,9 @@ def pretty_format(xml: str, indent: str = "    ") -> str:
 
     formatted = []
     level = 0
+    # Indent prefix per level, grown as the nesting deepens. Unbalanced
+    # closing tags can push level below zero; those lines get no indent.
+    indents = [""]
 
     for token in tokens:
         token = token.strip()
@@ -41,20 +50,22 @@ def pretty_format(xml: str, indent: str = "    ") -> str:
         elif token.startswith("</"):
             # Closing tag: decrease indent first
             level -= 1
-            formatted.append(f"{indent * level}{token}")
+            formatted.append(indents[level] + token if level > 0 else token)
 
         elif token.endswith("/>"):
             # Self-closing tag: same level
-            formatted.append(f"{indent * level}{token}")
+            formatted.append(indents[level] + token if level > 0 else token)
 
         elif token.startswith("<"):
             # Opening tag: print then increase level
-            formatted.append(f"{indent * level}{token}")
+            formatted.append(indents[level] + token if level > 0 else token)
             level += 1
+            if level == len(indents):
+                indents.append(indent * level)
 
         else:
             # Text node: print at current level
-            formatted.append(f"{indent * level}{token}")
+            formatted.append(indents[level] + token if level > 0 else token)
 
     return "\n".join(formatted)
 
@@ -63,14 +74,15 @@ def write_file(path: str, data: str) -> Tuple[bool, str]:
     """
     Writes data to a file in UTF-8.
     Returns (success, message).
+    Data is written as given: XML output is already formatted (or minified)
+    by XMLController, so it is not re-formatted here.
     """
     try:
         if "\\n" in data:
             data = data.replace("\\n", "\n")
-        formatted = pretty_format(data)
         with open(path, "w", encoding="utf-8") as file:
-            file.write(formatted)
-        return True, "XML file written successfully with formatting."
+            file.write(data)
+        return True, "File written successfully."
     except OSError as e:
         return False, f"File error: {e}"
 
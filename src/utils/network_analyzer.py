@@ -3,6 +3,8 @@ Network Analyzer - Advanced network analysis and recommendations.
 """
 
 from collections import defaultdict
+from heapq import nlargest
+from operator import itemgetter
 from typing import Dict, List, Optional, Set, Tuple
 import networkx as nx
 
@@ -39,12 +41,12 @@ class NetworkAnalyzer:
         if not in_degrees:
             return None
         
-        most_influential_id = max(in_degrees, key=in_degrees.get)
+        most_influential_id, followers = max(in_degrees.items(), key=itemgetter(1))
         
         return {
             'user_id': most_influential_id,
             'name': self.nodes_dict.get(most_influential_id, most_influential_id),
-            'followers': in_degrees[most_influential_id]
+            'followers': followers
         }
     
     def get_top_influencers(self, n: int = 5) -> List[Dict]:
@@ -61,7 +63,7 @@ class NetworkAnalyzer:
             return []
         
         in_degrees = dict(self.G.in_degree())
-        sorted_users = sorted(in_degrees.items(), key=lambda x: x[1], reverse=True)
+        sorted_users = sorted(in_degrees.items(), key=itemgetter(1), reverse=True)
         
         result = []
         for user_id, followers in sorted_users[:n]:
@@ -91,12 +93,12 @@ class NetworkAnalyzer:
         if not out_degrees:
             return None
         
-        most_active_id = max(out_degrees, key=out_degrees.get)
+        most_active_id, following = max(out_degrees.items(), key=itemgetter(1))
         
         return {
             'user_id': most_active_id,
             'name': self.nodes_dict.get(most_active_id, most_active_id),
-            'following': out_degrees[most_active_id]
+            'following': following
         }
     
     def get_top_active_users(self, n: int = 5) -> List[Dict]:
@@ -113,7 +115,7 @@ class NetworkAnalyzer:
             return []
         
         out_degrees = dict(self.G.out_degree())
-        sorted_users = sorted(out_degrees.items(), key=lambda x: x[1], reverse=True)
+        sorted_users = sorted(out_degrees.items(), key=itemgetter(1), reverse=True)
         
         result = []
         for user_id, following in sorted_users[:n]:
@@ -214,11 +216,11 @@ class NetworkAnalyzer:
                 if suggested_user not in following and suggested_user != user_id:
                     recommendations[suggested_user] += 1
         
-        # Sort by relevance score
-        sorted_recs = sorted(recommendations.items(), key=lambda x: x[1], reverse=True)
+        # Keep only the best `limit` by relevance score (same order as a full sort)
+        top_recs = nlargest(limit, recommendations.items(), key=itemgetter(1))
         
         result = []
-        for rec_user_id, score in sorted_recs[:limit]:
+        for rec_user_id, score in top_recs:
             result.append({
                 'user_id': rec_user_id,
                 'name': self.nodes_dict.get(rec_user_id, rec_user_id),
@@ -239,7 +241,8 @@ class NetworkAnalyzer:
             Dict mapping user_id to list of recommendations
         """
         result = {}
-        for user_id in user_ids:
+        # Each distinct user is computed once, even if listed several times
+        for user_id in dict.fromkeys(user_ids):
             result[user_id] = self.suggest_users_to_follow(user_id, limit)
         
         return result
@@ -322,7 +325,7 @@ class NetworkAnalyzer:
         for user_id in self.G.nodes():
             scores[user_id] = self.get_engagement_score(user_id)
         
-        sorted_users = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        sorted_users = sorted(scores.items(), key=itemgetter(1), reverse=True)
         
         result = []
         for user_id, score in sorted_users[:n]:
@@ -6,8 +6,12 @@ that other controllers (formatter, validator, parser) can depend on.
 
 from typing import List
 import pathlib
+import re
 from .file_io import read_file
 
+# Every '<' and '>' in the document; the text in between is never scanned in Python
+_DELIMITER_RE = re.compile(r'[<>]')
+
 
 def is_opening_tag(token: str) -> bool:
     """Returns True if token is an opening XML tag <...>."""
@@ -37,25 +41,22 @@ def tokenize(xml_string: str) -> List[str]:
     Simplest version: used in validator and parser.
     """
     tokens = []
-    buffer = ""
-    inside_tag = False
-
-    for ch in xml_string:
-        if ch == "<":
-            if buffer.strip():
-                tokens.append(buffer.strip())
-            buffer = "<"
-            inside_tag = True
-        elif ch == ">":
-            buffer += ">"
-            tokens.append(buffer)
-            buffer = ""
-            inside_tag = False
+    start = 0  # where the token currently being read begins
+
+    for match in _DELIMITER_RE.finditer(xml_string):
+        pos = match.start()
+        if xml_string[pos] == "<":
+            text = xml_string[start:pos].strip()
+            if text:
+                tokens.append(text)
+            start = pos
         else:
-            buffer += ch
+            tokens.append(xml_string[start:pos + 1])
+            start = pos + 1
 
-    if buffer.strip():
-        tokens.append(buffer.strip())
+    text = xml_string[start:].strip()
+    if text:
+        tokens.append(text)
 
     return tokens
 
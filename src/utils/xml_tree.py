@@ -7,6 +7,10 @@ from typing import Dict, List, Optional, Tuple
 import re
 
 
+# Start of a child element inside element content
+_CHILD_TAG_RE = re.compile(r'<(\w+)')
+
+
 class XMLNode:
     """Represents a node in the XML tree."""
     
@@ -176,10 +180,10 @@ class XMLTree:
     
     def _parse_content(self, parent: XMLNode, content: str) -> None:
         """Parse content that may contain text and/or child elements."""
-        content = content.strip()
+        # content arrives already stripped by _parse_element
         
         # Check if content is just text (no child elements)
-        if not re.search(r'<\w+', content):
+        if not _CHILD_TAG_RE.search(content):
             parent.text = content
             return
         
@@ -188,8 +192,8 @@ class XMLTree:
         text_parts = []
         
         while pos < len(content):
-            # Find next tag
-            tag_match = re.search(r'<(\w+)', content[pos:])
+            # Find next tag, scanning from pos without slicing the content
+            tag_match = _CHILD_TAG_RE.search(content, pos)
             
             if not tag_match:
                 # Remaining is text
@@ -199,12 +203,12 @@ class XMLTree:
                 break
             
             # Capture text before tag
-            text_before = content[pos:pos + tag_match.start()].strip()
+            text_before = content[pos:tag_match.start()].strip()
             if text_before:
                 text_parts.append(text_before)
             
             # Find the complete element
-            elem_start = pos + tag_match.start()
+            elem_start = tag_match.start()
             tag_name = tag_match.group(1)
             
             # Find opening tag end
@@ -0,0 +1,79 @@
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add parent directory to system path to allow imports from src folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Run Qt without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QThreadPool, QTimer
+from PySide6.QtWidgets import QApplication
+
+from src.ui import base_xml_window, manual_window
+from src.ui.manual_window import ManualWindow
+
+
+class TestBaseXMLWindow(unittest.TestCase):
+    """
+    Test suite for operation ordering in BaseXMLWindow.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        # Message boxes are modal; replace them so handlers run straight through
+        for module in (base_xml_window, manual_window):
+            patcher = mock.patch.object(module, "QMessageBox")
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.window = ManualWindow()
+        self.addCleanup(self.window.deleteLater)
+
+    def drain_background_ops(self):
+        """Wait for worker threads, then deliver their queued results."""
+        QThreadPool.globalInstance().waitForDone()
+        QTimer.singleShot(0, self.app.quit)
+        self.app.exec()
+
+    def test_sync_operation_supersedes_pending_background_result(self):
+        """
+        Test that a background format finishing after validate does not
+        overwrite the validation output.
+        """
+        self.window.input_text_box.setPlainText("<users><user><id>1</id></user></users>")
+        self.window.upload()
+
+        self.window.format_xml()
+        self.window.validate_xml()
+        validated = self.window.output_text
+
+        self.drain_background_ops()
+
+        self.assertEqual(self.window.output_text, validated)
+        self.assertEqual(self.window.result_text_box.toPlainText(), validated)
+
+    def test_background_operation_runs_on_input_snapshot(self):
+        """
+        Test that a background format works on the input as it was when
+        queued, even if the shared controller changes before it runs.
+        """
+        self.window.input_text_box.setPlainText("<users><user><id>1</id></user></users>")
+        self.window.upload()
+        expected = self.window.xml_controller.format()
+
+        self.window.format_xml()
+        self.window.xml_controller.set_xml_string("<other>changed</other>")
+
+        self.drain_background_ops()
+
+        self.assertEqual(self.window.output_text, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+import sys
+import os
+import json
+import io
+import contextlib
+
+# Add parent directory to system path to allow imports of cli and src
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import cli
+
+SAMPLES = os.path.join(os.path.dirname(__file__), '..', 'assets', 'samples')
+
+
+class TestCLI(unittest.TestCase):
+    """
+    Test suite for the command-line entry point in cli.py.
+    """
+
+    def test_json_command_writes_file(self):
+        """
+        Test that 'json -i <xml> -o <file>' writes the exported users as JSON.
+        """
+        sample = os.path.join(SAMPLES, 'Non_formatted_sample.xml')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = os.path.join(tmp_dir, 'out.json')
+
+            cli.main(["json", "-i", sample, "-o", out_path])
+
+            with open(out_path, 'r', encoding='utf-8') as f:
+                json_content = json.load(f)
+
+        users = json_content['users']
+        self.assertGreater(len(users), 0)
+        self.assertEqual(users[0]['id'], '1')
+        self.assertEqual(users[0]['name'], 'Ahmed Ali')
+        self.assertIsInstance(users[0]['posts'], list)
+
+    def test_emit_writes_text_stream(self):
+        """
+        Test that emit() writes through the text stream, like print(), so it
+        also works when stdout has no binary buffer.
+        """
+        captured = io.StringIO()
+        with contextlib.redirect_stdout(captured):
+            cli.emit("<a>é</a>")
+
+        self.assertEqual(captured.getvalue(), "<a>é</a>\n")
+
+    def test_emit_translates_newlines(self):
+        """
+        Test that emit() output gets the stream's newline translation.
+        """
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8", newline="\r\n")
+        with contextlib.redirect_stdout(stream):
+            cli.emit("<a>\n</a>")
+        stream.flush()
+
+        self.assertEqual(raw.getvalue(), b"<a>\r\n</a>\r\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+import sys
+import os
+
+# Add parent directory to system path to allow imports from src folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import file_io
+
+
+class TestFileIO(unittest.TestCase):
+    """
+    Test suite for the file_io read/write helpers.
+    """
+
+    def test_write_file_writes_data_unchanged(self):
+        """
+        Test that write_file saves its payload as given, without re-formatting.
+
+        Minified XML and inline leaf elements must not be split onto new lines.
+        """
+        data = '<users><user><id>1</id><name>Ali</name></user></users>'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'out.xml')
+
+            ok, message = file_io.write_file(path, data)
+
+            self.assertTrue(ok, message)
+            with open(path, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read(), data)
+
+    def test_write_file_round_trips_with_read_file(self):
+        """
+        Test that text written by write_file reads back identically, including non-ASCII.
+        """
+        data = '{\n  "name": "Ahmed Ali é"\n}'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'out.json')
+            file_io.write_file(path, data)
+
+            source = file_io.read_file(path)
+
+        self.assertTrue(source.ok)
+        self.assertEqual(source.data, data)
+
+
+if __name__ == '__main__':
+    unittest.main()
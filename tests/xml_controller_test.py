@@ -1,4 +1,3 @@
-import tempfile
 import unittest
 import sys
 import os
@@ -12,6 +11,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 # NOTE: Class name is capitalized following Python naming conventions
 from src.controllers.xml_controller import XMLController 
 
+SAMPLES = os.path.join(os.path.dirname(__file__), '..', 'assets', 'samples')
+
 class TestXMLController(unittest.TestCase):
     """
     Test suite for XMLController class.
@@ -185,8 +186,7 @@ class TestXMLController(unittest.TestCase):
 
     def test_export_to_json(self):
         """
-        Test the export_to_json method for correct data transformation
-        and file creation using a temporary file.
+        Test the export_to_json method for correct data transformation.
         """
         # 1. Setup Mock XML Data
         mock_xml = """
@@ -222,27 +222,10 @@ class TestXMLController(unittest.TestCase):
         # 2. Set XML string
         self.controller.set_xml_string(mock_xml)
         
-        # 3. Use a temporary file path
-        # This creates a file path in the system's temp directory
-        with tempfile.NamedTemporaryFile(mode='r', delete=False, suffix='.json') as tmp:
-            test_file_path = tmp.name
-        
-        # 4. Execute the method
-        # We ensure the custom-coded '_get_tag_info' is defined and called.
-        success, message, error = self.controller.export_to_json(test_file_path)
+        # 3. Execute the method; it returns the JSON-ready dict
+        json_content = self.controller.export_to_json()
 
-        # 5. Assertions (Verify the result)
-        self.assertTrue(success, f"JSON export failed. Message: {message}, Error: {error}")
-        self.assertIn("exported 2 users", message)
-
-        # 6. Read the content of the exported file
-        try:
-            with open(test_file_path, 'r', encoding='utf-8') as f:
-                json_content = json.load(f)
-        except Exception as e:
-            self.fail(f"Failed to read or parse exported JSON file: {e}")
-            
-        # 7. Verify JSON Structure and Content
+        # 4. Verify JSON Structure and Content
         
         # A. Check total user count
         self.assertEqual(len(json_content.get('users', [])), 2)
@@ -272,9 +255,116 @@ class TestXMLController(unittest.TestCase):
         self.assertEqual(user2['followers'], [])
         self.assertEqual(user2['followings'], [])
         # --------------------------------------
-        # 8. Cleanup the temporary file
-        os.remove(test_file_path)
-        
+
+    def test_export_to_json_text_before_id(self):
+        """
+        Test that export_to_json handles a user whose first text is not an id.
+
+        Regression: the id check read parent_tag before any <id> had set it,
+        raising UnboundLocalError on documents like this one.
+        """
+        self.controller.set_xml_string(
+            "<users><user><name>Bob</name><id>7</id></user></users>"
+        )
+
+        json_content = self.controller.export_to_json()
+
+        self.assertEqual(json_content, {'users': [{
+            'id': '7', 'name': 'Bob', 'posts': [], 'followers': [], 'followings': []
+        }]})
+
+    def assert_round_trip(self, xml):
+        """
+        Compress xml, decompress the result and check the text is unchanged.
+        """
+        self.controller.set_xml_string(xml)
+        compressed = self.controller.compress_to_string()
+        self.assertEqual(self.controller.decompress_from_string(compressed), xml)
+
+    def test_compress_round_trip_edge_cases(self):
+        """
+        Test that compression round-trips empty, one-character and repetitive input.
+        """
+        self.assert_round_trip("")
+        self.assert_round_trip("a")
+        self.assert_round_trip("<user><id>1</id></user>" * 200)
+
+    def test_compress_round_trip_samples(self):
+        """
+        Test that every bundled sample survives a compress/decompress round trip.
+        """
+        for name in sorted(os.listdir(SAMPLES)):
+            if name.endswith('.xml'):
+                with self.subTest(sample=name):
+                    with open(os.path.join(SAMPLES, name), 'r', encoding='utf-8') as f:
+                        self.assert_round_trip(f.read())
+
+    def test_compress_round_trip_latin_extended(self):
+        """
+        Test that characters U+0100..U+0163 survive compression.
+
+        Regression: merged ids always started at 256, so these characters
+        collided with merge ids and were expanded on decompression
+        ('hello' * 50 + 'ĀāĂ' came back ending in 'helhell').
+        """
+        self.assert_round_trip('ĀāĂ' * 50)
+        self.assert_round_trip('<p>ĀāĂ</p>' * 50)
+        self.assert_round_trip('hello' * 50 + 'ĀāĂ')
+        self.assert_round_trip(''.join(map(chr, range(0x100, 0x164))) * 5)
+
+    def test_compress_round_trip_beyond_bmp(self):
+        """
+        Test that characters beyond the BMP (e.g. emoji) survive compression.
+
+        They used to be truncated to their low 16 bits.
+        """
+        self.assert_round_trip('😀' * 100)
+        self.assert_round_trip('<post>hi 😀 there</post>' * 50)
+        self.assert_round_trip('\ufeff\uffff' + 'ĀāĂ' * 50)
+
+    def test_compress_size_with_one_emoji(self):
+        """
+        Test that one character beyond the BMP does not switch merging off.
+
+        It used to push the first merge id past the u16 range, so a sample
+        with a single emoji compressed to several times its normal size.
+        """
+        with open(os.path.join(SAMPLES, 'Large_size_sample.xml'), 'r', encoding='utf-8') as f:
+            xml = f.read()
+
+        self.controller.set_xml_string(xml)
+        plain_size = len(self.controller.compress_to_string())
+        self.controller.set_xml_string(xml.replace('</users>', '😀</users>'))
+        emoji_size = len(self.controller.compress_to_string())
+
+        # the emoji adds one surrogate pair: two more u16 tokens
+        self.assertLessEqual(emoji_size, plain_size + 4)
+
+    def test_compress_golden_output(self):
+        """
+        Test that compression produces exactly the same bytes for small inputs.
+
+        Pins the pair-selection order (most frequent first, ties to the pair
+        that occurs first) and the stopping rule, so changes to either show up
+        here instead of silently changing the compressed format.
+        """
+        golden = {
+            "a": "00000000010000006100",
+            "<a>x</a>": "00000000080000003c0061003e0078003c002f0061003e00",
+            "abababab": "01000000610062000001040000000001000100010001",
+            "<a>b</a>" * 20: (
+                "0900000061003e0000013c000001010101016200020102013c0003010301"
+                "2f0004010401000105010501050106010601060107010701070108010300"
+                "0000080108010701"
+            ),
+        }
+        for xml, expected_hex in golden.items():
+            with self.subTest(xml=xml[:16]):
+                self.controller.set_xml_string(xml)
+                compressed = self.controller.compress_to_string()
+                self.assertEqual(compressed.encode("latin-1").hex(), expected_hex)
+
+
 xml_test = """
 <?xml version="1.0" encoding="UTF-8"?>
 <users>
@@ -431,59 +521,67 @@ xml_test = """
         </followings>
 """
 
-# Create controller instance
-controller_test = XMLController(xml_test)
-
-print("=" * 80)
-print("VALIDATION REPORT (BEFORE CORRECTION)")
-print("=" * 80)
-annotated_xml, error_counts = controller_test.validate()
-print(annotated_xml)
-print(f"\nError counts: {error_counts}")
-
-print("\n" + "=" * 80)
-print("AUTO-CORRECTING XML...")
-print("=" * 80)
-
-# Auto-correct the XML (this returns a tuple: corrected XML string and correction counts)
-corrected_xml, correction_counts = controller_test.autocorrect()
-
-print("\n✓ Auto-correction completed!")
-print(f"Correction counts: {correction_counts}")
-
-# Write corrected XML to file
-formatted_filename = "corrected_formatted.xml"
-with open(formatted_filename, 'w', encoding='utf-8') as f:
-    f.write(corrected_xml)
-
-print(f"✓ Corrected XML written to '{formatted_filename}'")
-
-print("\n" + "=" * 80)
-print("VALIDATION REPORT (AFTER CORRECTION)")
-print("=" * 80)
-annotated_xml_after, error_counts_after = controller_test.validate()
-print(annotated_xml_after)
-print(f"\nError counts: {error_counts_after}")
-
-# Also write the minified version
-minified_xml = controller_test.minify()
-minified_filename = "corrected_minified.xml"
-with open(minified_filename, 'w', encoding='utf-8') as f:
-    f.write(minified_xml)
-
-print(f"\n✓ Minified XML written to '{minified_filename}'")
-
-# Export to JSON
-json_filename = "xml_to_json.json"
-success, message, error = controller_test.export_to_json(json_filename)
-
-print("\n" + "=" * 80)
-if success:
-    print(f"JSON EXPORT SUCCESS: {message}")
-else:
-    print(f"JSON EXPORT FAILED: {error}")
-print("=" * 80)
+
+def run_demo():
+    """
+    Validate, auto-correct, minify and export the broken xml_test document,
+    printing each report. Only runs when this file is executed directly.
+    """
+    # Create controller instance
+    controller_test = XMLController(xml_test)
+
+    print("=" * 80)
+    print("VALIDATION REPORT (BEFORE CORRECTION)")
+    print("=" * 80)
+    annotated_xml, error_counts = controller_test.validate()
+    print(annotated_xml)
+    print(f"\nError counts: {error_counts}")
+
+    print("\n" + "=" * 80)
+    print("AUTO-CORRECTING XML...")
+    print("=" * 80)
+
+    # Auto-correct the XML (this returns a tuple: corrected XML string and correction counts)
+    corrected_xml, correction_counts = controller_test.autocorrect()
+
+    print("\n✓ Auto-correction completed!")
+    print(f"Correction counts: {correction_counts}")
+
+    # Write corrected XML to file
+    formatted_filename = "corrected_formatted.xml"
+    with open(formatted_filename, 'w', encoding='utf-8') as f:
+        f.write(corrected_xml)
+
+    print(f"✓ Corrected XML written to '{formatted_filename}'")
+
+    print("\n" + "=" * 80)
+    print("VALIDATION REPORT (AFTER CORRECTION)")
+    print("=" * 80)
+    annotated_xml_after, error_counts_after = controller_test.validate()
+    print(annotated_xml_after)
+    print(f"\nError counts: {error_counts_after}")
+
+    # Also write the minified version
+    minified_xml = controller_test.minify()
+    minified_filename = "corrected_minified.xml"
+    with open(minified_filename, 'w', encoding='utf-8') as f:
+        f.write(minified_xml)
+
+    print(f"\n✓ Minified XML written to '{minified_filename}'")
+
+    # Export to JSON
+    json_filename = "xml_to_json.json"
+    json_data = controller_test.export_to_json()
+    with open(json_filename, 'w', encoding='utf-8') as f:
+        json.dump(json_data, f, indent=2, ensure_ascii=False)
+
+    print("\n" + "=" * 80)
+    print(f"JSON EXPORT SUCCESS: exported {len(json_data['users'])} users to '{json_filename}'")
+    print("=" * 80)
+
+
 # Standard Python idiom to run tests when script is executed directly
-if __name__ == '__main__': #Corrected from '_main_'
+if __name__ == '__main__':
+    run_demo()
     # Run all test methods in this test case
-   unittest.main()
\ No newline at end of file
+    unittest.main()